@@ -1,78 +1,358 @@
 """Configuration management for BigFoot."""
 
+import copy
+import functools
+import json
 import os
-import yaml
+import re
+from types import MappingProxyType
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+
+DEFAULT_JSON_PATH = 'config.json'
+DEFAULT_YAML_PATH = 'config.yaml'
+
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'settings': {
+        'timezone': 'UTC',
+        'daily_goal': 10,
+        'show_progress': True,
+        'color_output': True,
+        'compact_mode': False
+    }
+}
+# Read-only view for getters that never mutate the defaults
+_DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType(_DEFAULT_CONFIG['settings'])
+
+# Start of a top-level YAML mapping key (no indentation, not a comment or list item)
+_TOP_LEVEL_KEY = re.compile(rb'^[^\s#-]', re.MULTILINE)
+
+# Parsed config files keyed by (absolute path, mtime_ns, size)
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _cache_key(path: str, st: Optional[os.stat_result] = None) -> tuple:
+    """Build the parse-cache key for a config file from its stat."""
+    if st is None:
+        st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_support() -> tuple:
+    """Import PyYAML on first use, so JSON-only runs never load it.
+    
+    Prefers libyaml's C loader/dumper; BIGFOOT_FORCE_PYYAML forces the
+    pure-Python path.
+    
+    Returns:
+        Tuple of (yaml module, safe loader class, safe dumper class)
+    """
+    import yaml
+    if not os.getenv('BIGFOOT_FORCE_PYYAML'):
+        try:
+            return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+        except AttributeError:
+            pass
+    return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+
+def _parse_yaml(data: bytes) -> Any:
+    """Parse YAML with the safe loader, raising ValueError on invalid input."""
+    yaml, loader, _ = _yaml_support()
+    try:
+        return yaml.load(data, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ValueError(str(e)) from e
+
+
+def _dump_yaml(config: Dict[str, Any]) -> str:
+    """Serialize a config with the safe dumper, raising ValueError on failure."""
+    yaml, _, dumper = _yaml_support()
+    try:
+        return yaml.dump(config, Dumper=dumper, default_flow_style=False, indent=2)
+    except yaml.YAMLError as e:
+        raise ValueError(str(e)) from e
+
+
+def _json_round_trips(config: Dict[str, Any]) -> bool:
+    """Check that a config survives a JSON round trip unchanged.
+    
+    YAML can hold values JSON cannot, such as dates, and JSON would turn
+    non-string keys into strings.
+    """
+    try:
+        return json.loads(json.dumps(config)) == config
+    except (TypeError, ValueError):
+        return False
+
+
+def _read_bytes(path: str, size: Optional[int] = None) -> bytes:
+    """Read a file as raw bytes, bypassing text decoding and buffering.
+    
+    Args:
+        path: File to read
+        size: Maximum number of bytes to read. Defaults to the whole file
+        
+    Returns:
+        File contents
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if size is None:
+            size = os.fstat(fd).st_size
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _resolve_config_path(config_path: Optional[str]) -> Tuple[str, bool]:
+    """Resolve the config file location.
+    
+    Args:
+        config_path: Explicit path, or None to use BIGFOOT_CONFIG_PATH or the default
+        
+    Returns:
+        Tuple of (path, whether it is a legacy default YAML file to migrate)
+    """
+    if config_path is None:
+        config_path = os.getenv('BIGFOOT_CONFIG_PATH')
+    if config_path is not None:
+        return config_path, False
+    if not os.path.exists(DEFAULT_JSON_PATH) and os.path.exists(DEFAULT_YAML_PATH):
+        return DEFAULT_YAML_PATH, True
+    return DEFAULT_JSON_PATH, False
+
+
+# Shared Config instances keyed by absolute config path
+_INSTANCES: Dict[str, 'Config'] = {}
 
 
 class Config:
-    """Configuration manager for BigFoot."""
+    """Configuration manager for BigFoot.
+    
+    Instances are shared per config file: constructing Config for a path that
+    is already in use returns the existing instance, so every caller in the
+    process sees the same settings.
+    """
+    
+    def __new__(cls, config_path: str = None):
+        path, _ = _resolve_config_path(config_path)
+        key = os.path.abspath(path)
+        instance = _INSTANCES.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._initialized = False
+            _INSTANCES[key] = instance
+        return instance
     
     def __init__(self, config_path: str = None):
         """Initialize configuration.
         
         Args:
-            config_path: Path to config file. Defaults to config.yaml in current directory
+            config_path: Path to config file. Defaults to config.json in current
+                directory, falling back to an existing config.yaml
         """
-        if config_path is None:
-            config_path = os.getenv('BIGFOOT_CONFIG_PATH', 'config.yaml')
+        if self._initialized:
+            return
         
-        self.config_path = config_path
-        self.config = self._load_config()
+        # Legacy default YAML files are migrated to JSON on the next save
+        self.config_path, self._migrate_to_json = _resolve_config_path(config_path)
+        self._config: Optional[Dict[str, Any]] = None
+        self._settings: Dict[str, Any] = {}
+        self._header_settings: Optional[Dict[str, Any]] = None
+        self._initialized = True
+    
+    def reload(self) -> None:
+        """Discard loaded values so the next access re-reads the config file."""
+        self._config = None
+        self._settings = {}
+        self._header_settings = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dict, parsed from disk on first access."""
+        if self._config is None:
+            self._bind(self._load_config())
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._bind(value)
+    
+    def _bind(self, config: Dict[str, Any]) -> None:
+        """Install a loaded config and cache its live settings section."""
+        settings = config.get('settings')
+        if not isinstance(settings, dict):
+            settings = config['settings'] = {}
+        self._config = config
+        self._settings = settings
+    
+    def _load_settings(self) -> Dict[str, Any]:
+        """Get the live settings section of the fully loaded config."""
+        if self._config is None:
+            self._bind(self._load_config())
+        return self._settings
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default."""
-        if os.path.exists(self.config_path):
+        try:
+            fd = os.open(self.config_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return self._get_default_config()
+        
+        try:
+            st = os.fstat(fd)
+            key = _cache_key(self.config_path, st)
+            if key in _CONFIG_CACHE:
+                return copy.deepcopy(_CONFIG_CACHE[key])
+            
             try:
-                with open(self.config_path, 'r') as f:
-                    return yaml.safe_load(f) or {}
-            except (yaml.YAMLError, IOError) as e:
+                data = os.read(fd, st.st_size)
+                if self._is_json():
+                    config = json.loads(data) or {}
+                else:
+                    config = _parse_yaml(data) or {}
+            except (ValueError, IOError) as e:
                 print(f"Warning: Could not load config file: {e}")
                 return self._get_default_config()
-        else:
-            return self._get_default_config()
+        finally:
+            os.close(fd)
+        
+        _CONFIG_CACHE[key] = copy.deepcopy(config)
+        return config
+    
+    def _load_header(self, max_bytes: int = 4096) -> Optional[Dict[str, Any]]:
+        """Parse only the leading top-level sections of a YAML config file.
+        
+        Args:
+            max_bytes: Maximum number of bytes to read from the start of the file
+            
+        Returns:
+            Parsed header mapping, or None if the header cannot be used
+            
+        Raises:
+            FileNotFoundError: If the config file does not exist
+        """
+        try:
+            data = _read_bytes(self.config_path, max_bytes + 1)
+        except FileNotFoundError:
+            raise
+        except IOError:
+            return None
+        
+        if len(data) > max_bytes:
+            data = data[:max_bytes]
+            # Drop the last (possibly incomplete) top-level section
+            boundaries = [m.start() for m in _TOP_LEVEL_KEY.finditer(data)]
+            if len(boundaries) < 2:
+                return None
+            data = data[:boundaries[-1]]
+        
+        try:
+            header = _parse_yaml(data)
+        except ValueError:
+            return None
+        return header if isinstance(header, dict) else None
+    
+    def _get_settings(self) -> Mapping[str, Any]:
+        """Get the settings section, avoiding a full parse when possible."""
+        if self._config is not None:
+            return self._settings
+        if not self._is_json():
+            if self._header_settings is None:
+                try:
+                    header = self._load_header()
+                except FileNotFoundError:
+                    return _DEFAULT_SETTINGS
+                if header is not None and isinstance(header.get('settings'), dict):
+                    self._header_settings = header['settings']
+            if self._header_settings is not None:
+                return self._header_settings
+        return self._load_settings()
     
     def _get_default_config(self) -> Dict[str, Any]:
-        """Get default configuration."""
-        return {
-            'settings': {
-                'timezone': 'UTC',
-                'daily_goal': 10,
-                'show_progress': True,
-                'color_output': True,
-                'compact_mode': False
-            }
-        }
+        """Get a mutable copy of the default configuration."""
+        return copy.deepcopy(_DEFAULT_CONFIG)
+    
+    def _is_json(self) -> bool:
+        """Check whether the config file uses the JSON format."""
+        return self.config_path.endswith('.json')
     
     def save_config(self) -> None:
-        """Save current configuration to file."""
+        """Save current configuration to file.
+        
+        The file is written to a temporary sibling and renamed into place, so
+        an interrupted save never leaves a truncated config behind.
+        """
+        config = self.config
+        abs_path = os.path.abspath(self.config_path)
+        for key in [key for key in _CONFIG_CACHE if key[0] == abs_path]:
+            del _CONFIG_CACHE[key]
+        
+        # Legacy YAML configs are written to the default JSON path instead,
+        # unless JSON cannot represent them; nothing switches over until that
+        # file is safely in place
+        migrate = self._migrate_to_json and _json_round_trips(config)
+        target_path = DEFAULT_JSON_PATH if migrate else self.config_path
+        tmp_path = f"{target_path}.tmp"
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
-        except IOError as e:
+            if target_path.endswith('.json'):
+                data = json.dumps(config, indent=2)
+            else:
+                data = _dump_yaml(config)
+            with open(tmp_path, 'w') as f:
+                f.write(data)
+            os.replace(tmp_path, target_path)
+        except (IOError, TypeError, ValueError) as e:
             raise Exception(f"Could not save config file: {e}")
+        finally:
+            # Never leave a partial file behind, whatever went wrong
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+        
+        if migrate:
+            legacy_path, self.config_path = self.config_path, target_path
+            self._migrate_to_json = False
+            _INSTANCES[os.path.abspath(target_path)] = self
+            if os.path.abspath(legacy_path) != os.path.abspath(target_path):
+                try:
+                    os.remove(legacy_path)
+                except FileNotFoundError:
+                    pass
+        
+        _CONFIG_CACHE[_cache_key(target_path)] = copy.deepcopy(config)
     
     
     def get_daily_goal(self) -> int:
         """Get daily commit goal."""
-        return self.config.get('settings', {}).get('daily_goal', 10)
+        return self._get_settings().get('daily_goal', 10)
     
     def set_daily_goal(self, goal: int) -> None:
         """Set daily commit goal."""
-        if 'settings' not in self.config:
-            self.config['settings'] = {}
-        self.config['settings']['daily_goal'] = goal
+        self._load_settings()['daily_goal'] = goal
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value."""
-        return self.config.get('settings', {}).get(key, default)
+        return self._get_settings().get(key, default)
+    
+    def get_settings(self, keys: List[str], defaults: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Get several setting values with a single settings lookup.
+        
+        Args:
+            keys: Setting names to fetch
+            defaults: Fallback values for missing settings, keyed by name
+            
+        Returns:
+            Dictionary mapping each key to its value (or default)
+        """
+        settings = self._get_settings()
+        defaults = defaults or {}
+        return {key: settings.get(key, defaults.get(key)) for key in keys}
     
     def set_setting(self, key: str, value: Any) -> None:
         """Set a setting value."""
-        if 'settings' not in self.config:
-            self.config['settings'] = {}
-        self.config['settings'][key] = value
+        self._load_settings()[key] = value
     
     def is_configured(self) -> bool:
         """Check if BigFoot is properly configured."""
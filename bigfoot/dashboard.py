@@ -1,14 +1,23 @@
 """Motivational dashboard and analytics engine for BigFoot."""
 
-import os
-import sqlite3
-from datetime import datetime, date, timedelta
-from typing import List, Dict, Optional, Tuple, NamedTuple
+import bisect
+import functools
+import inspect
+import itertools
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Tuple, NamedTuple
 from dataclasses import dataclass
 from enum import Enum
 from .database import Database
 
 
+# Slotted dataclasses skip the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class PerformanceLevel(Enum):
     """User performance categorization for motivational messaging."""
     STARTING = "starting"          # New user or low activity
@@ -17,7 +26,7 @@ class PerformanceLevel(Enum):
     LEGENDARY = "legendary"        # Exceptional performance
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class StreakData:
     """Streak information and progress."""
     current_streak: int
@@ -28,19 +37,19 @@ class StreakData:
     is_active_today: bool
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class MomentumMetrics:
     """Momentum and trend analysis."""
     this_week_commits: int
     last_week_commits: int
     week_over_week_change: float
-    daily_trend: List[int]  # Last 7 days
+    daily_trend: Tuple[int, ...]  # Last 7 days
     average_daily: float
     consistency_score: int  # Days active out of 7
     performance_level: PerformanceLevel
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Achievement:
     """Achievement/badge information."""
     id: str
@@ -51,7 +60,7 @@ class Achievement:
     progress: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class GoalProgress:
     """Goal tracking and progress."""
     daily_goal: int
@@ -65,7 +74,7 @@ class GoalProgress:
     monthly_progress: float
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class PersonalRecord:
     """Personal best performance record."""
     record_type: str  # 'daily_commits', 'daily_lines', 'weekly_commits', etc.
@@ -74,7 +83,7 @@ class PersonalRecord:
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class HallOfFame:
     """Hall of Fame with personal records and achievements."""
     best_single_day_commits: PersonalRecord
@@ -86,7 +95,7 @@ class HallOfFame:
     record_chase_progress: float  # How close to beating current record
 
 
-@dataclass 
+@dataclass(**_DATACLASS_OPTIONS)
 class HistoricalPeriod:
     """Single time period data for historical charts."""
     label: str              # Display label (e.g., "Mar 15", "W12", "March")
@@ -96,10 +105,17 @@ class HistoricalPeriod:
     period_type: str        # 'daily', 'weekly', 'monthly'
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class HistoricalData:
-    """Complete historical chart data and analysis."""
-    periods: List[HistoricalPeriod]
+    """Complete historical chart data and analysis.
+    
+    Per-period values are stored as parallel columns, oldest first. Use
+    `periods` to get them back as HistoricalPeriod objects.
+    """
+    labels: List[str]                  # Display label per period
+    start_dates: List[str]             # ISO date string per period
+    end_dates: List[str]               # ISO date string per period
+    commits: List[int]                 # Total commits per period
     chart_type: str                    # 'daily', 'weekly', 'monthly'
     total_commits: int
     peak_commits: int
@@ -107,6 +123,121 @@ class HistoricalData:
     trend_direction: str               # 'up', 'down', 'stable'
     trend_percentage: float
     date_range_label: str              # "Last 90 days", "Last 13 weeks", etc.
+    
+    @property
+    def periods(self) -> List[HistoricalPeriod]:
+        """Periods as HistoricalPeriod objects, built on each access."""
+        return [
+            HistoricalPeriod(label, start_date, end_date, commits, self.chart_type)
+            for label, start_date, end_date, commits
+            in zip(self.labels, self.start_dates, self.end_dates, self.commits)
+        ]
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class _DateContext:
+    """Reference date and the window boundaries derived from it, parsed once."""
+    target_date: str        # ISO reference date
+    end_date: date          # Parsed reference date
+    week_start: str         # First day of the last 7 days
+    last_week_start: str    # First day of the 7 days before that
+    month_start: str        # First day of the reference month
+
+
+# Streak milestones, in ascending order; the last one is the cap
+_MILESTONES = (7, 14, 21, 30, 50, 75, 100, 200, 365, 1000)
+
+# Performance levels, best first: (week commits, days active, daily average, level)
+_PERFORMANCE_THRESHOLDS = (
+    (50, 6, 7, PerformanceLevel.LEGENDARY),   # Exceptional performance across all metrics
+    (25, 5, 4, PerformanceLevel.CRUSHING),    # High performance, on fire
+    (10, 3, 2, PerformanceLevel.BUILDING),    # Moderate activity, building momentum
+)
+
+# Most analytics results kept per DashboardAnalytics instance
+_MEMO_MAX_ENTRIES = 64
+
+# Achievement categories accepted by get_achievements(), by data source
+_ACHIEVEMENT_CATEGORIES = ('streak', 'volume', 'consistency')
+
+class _AchievementDef(NamedTuple):
+    """Static definition of an achievement badge."""
+    id: str
+    name: str
+    emoji: str
+    description: str
+    threshold: int
+    metric: str             # Value in get_achievements() compared to the threshold
+
+
+_ACHIEVEMENTS = (
+    # Streak achievements
+    _AchievementDef('first_step', 'First Step', '👶', 'Made your first commit', 1, 'best_streak'),
+    _AchievementDef('fire_starter', 'Fire Starter', '🔥', '3 day coding streak', 3, 'current_streak'),
+    _AchievementDef('consistent_coder', 'Consistent Coder', '⚡', '7 day coding streak', 7, 'current_streak'),
+    _AchievementDef('streak_master', 'Streak Master', '🎯', '21 day coding streak', 21, 'current_streak'),
+    _AchievementDef('code_warrior', 'Code Warrior', '🎖️', '30 day coding streak', 30, 'current_streak'),
+    
+    # Volume achievements - Daily Commits
+    _AchievementDef('commit_surge', 'Commit Surge', '💥', '5 commits in one day', 5, 'best_day_commits'),
+    _AchievementDef('commit_storm', 'Commit Storm', '⛈️', '8 commits in one day', 8, 'best_day_commits'),
+    _AchievementDef('commit_hurricane', 'Commit Hurricane', '🌪️', '12 commits in one day', 12, 'best_day_commits'),
+    _AchievementDef('commit_legend', 'Commit Legend', '👑', '15 commits in one day', 15, 'best_day_commits'),
+    
+    # Volume achievements - Daily Lines
+    _AchievementDef('line_crusher', 'Line Crusher', '💪', '1,000 lines in one day', 1000, 'best_day_lines'),
+    _AchievementDef('code_beast', 'Code Beast', '🦁', '5,000 lines in one day', 5000, 'best_day_lines'),
+    _AchievementDef('coding_machine', 'Coding Machine', '🤖', '10,000 lines in one day', 10000, 'best_day_lines'),
+    _AchievementDef('line_god', 'Line God', '🚀', '50,000 lines in one day', 50000, 'best_day_lines'),
+    
+    # Consistency achievements
+    _AchievementDef('perfect_week', 'Perfect Week', '⭐', '7 days of coding in a row', 7, 'consistency'),
+    _AchievementDef('momentum_builder', 'Momentum Builder', '📈', 'Increased weekly commits by 25%+', 25, 'week_over_week'),
+)
+
+
+def _memoize_on_db(method):
+    """Memoize an analytics method until the database changes.
+    
+    Results are cached per instance, keyed by the bound call arguments with
+    a missing target_date resolved to today, so positional, keyword and
+    defaulted calls for the same day share one entry. The whole cache is
+    dropped as soon as the database is written or the day rolls over, and
+    the oldest entries are evicted beyond _MEMO_MAX_ENTRIES. Cached results
+    are shared between callers, so they are returned as frozen dataclasses,
+    tuples and read-only mappings.
+    """
+    signature = inspect.signature(method)
+    
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        today = date.today()
+        version = (self._db_version(), today)
+        if version != self._memo_version:
+            self._memo.clear()
+            self._memo_version = version
+        
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        if 'target_date' in bound.arguments and bound.arguments['target_date'] is None:
+            bound.arguments['target_date'] = today.isoformat()
+        key = (method.__name__,) + tuple(bound.arguments.values())[1:]
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        
+        result = method(*bound.args, **bound.kwargs)
+        # May race with other threads; a lost eviction only delays the bound
+        while len(self._memo) >= _MEMO_MAX_ENTRIES:
+            try:
+                del self._memo[next(iter(self._memo))]
+            except (KeyError, StopIteration, RuntimeError):
+                break
+        self._memo[key] = result
+        return result
+    
+    return wrapper
 
 
 class DashboardAnalytics:
@@ -120,7 +251,47 @@ class DashboardAnalytics:
         """
         self.database = database
         self.db_path = database.db_path
+        self._memo: Dict[tuple, object] = {}
+        self._memo_version: Optional[Tuple[int, date]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def _db_version(self) -> int:
+        """Get a version number of the database that changes on every write."""
+        return self.database.data_version()
+    
+    def close(self) -> None:
+        """Stop the worker threads and close the database's shared connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.database.close()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used to run independent queries concurrently."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='bigfoot-analytics')
+        return self._executor
+    
+    def _date_context(self, target_date: Optional[str]) -> _DateContext:
+        """Parse a reference date and derive its window boundaries once.
+        
+        Args:
+            target_date: Reference date in YYYY-MM-DD format (defaults to today)
+            
+        Returns:
+            _DateContext for the reference date
+        """
+        end_date = date.fromisoformat(target_date) if target_date else date.today()
+        week_start = end_date - timedelta(days=6)
+        return _DateContext(
+            target_date=end_date.isoformat(),
+            end_date=end_date,
+            week_start=week_start.isoformat(),
+            last_week_start=(week_start - timedelta(days=7)).isoformat(),
+            month_start=end_date.replace(day=1).isoformat()
+        )
     
+    @_memoize_on_db
     def get_streak_data(self, target_date: str = None) -> StreakData:
         """Calculate current streak information.
         
@@ -133,17 +304,31 @@ class DashboardAnalytics:
         if target_date is None:
             target_date = date.today().isoformat()
         
-        current_streak = self.database.calculate_streak(target_date)
-        longest_streak = self._get_longest_streak()
+        return self._build_streak_data(
+            self.database.calculate_streak(target_date),
+            self._get_longest_streak(),
+            self._total_commits_on(target_date)
+        )
+    
+    def _build_streak_data(self, current_streak: int, longest_streak: int,
+                           today_commits: int) -> StreakData:
+        """Build StreakData from already fetched streak lengths.
         
+        Args:
+            current_streak: Current streak length in days
+            longest_streak: Longest ever streak in days
+            today_commits: Total commits on the target date
+            
+        Returns:
+            StreakData with current streak and progress
+        """
         # Determine next milestone
-        milestones = [7, 14, 21, 30, 50, 75, 100, 200, 365]
-        next_milestone = next((m for m in milestones if m > current_streak), 1000)
+        milestone_index = bisect.bisect_right(_MILESTONES, current_streak)
+        next_milestone = _MILESTONES[min(milestone_index, len(_MILESTONES) - 1)]
         days_to_milestone = next_milestone - current_streak
         goal_progress = current_streak / next_milestone if next_milestone > 0 else 1.0
         
         # Check if user coded today
-        today_commits = self.database.get_total_commits_by_date(target_date)
         is_active_today = today_commits > 0
         
         return StreakData(
@@ -155,6 +340,7 @@ class DashboardAnalytics:
             is_active_today=is_active_today
         )
     
+    @_memoize_on_db
     def calculate_momentum(self, target_date: str = None, days: int = 7) -> MomentumMetrics:
         """Calculate momentum and performance trends.
         
@@ -165,23 +351,39 @@ class DashboardAnalytics:
         Returns:
             MomentumMetrics with trend analysis
         """
-        if target_date is None:
-            target_date = date.today().isoformat()
+        ctx = self._date_context(target_date)
+        trend_start = ctx.end_date - timedelta(days=days-1)
         
-        end_date = datetime.strptime(target_date, '%Y-%m-%d').date()
+        # Fetch per-day totals for both weeks and the trend window at once
+        start_date = min(ctx.last_week_start, trend_start.isoformat())
+        daily_totals = self._daily_commit_totals(start_date, ctx.target_date)
         
-        # Get this week's commits (last 7 days)
-        week_start = end_date - timedelta(days=6)
-        this_week_commits = self.database.get_weekly_commits(
-            week_start.isoformat(), end_date.isoformat()
-        )
+        return self._build_momentum(ctx, days, daily_totals)
+    
+    def _build_momentum(self, ctx: _DateContext, days: int,
+                        daily_totals: Dict[str, int]) -> MomentumMetrics:
+        """Build MomentumMetrics from per-day commit totals.
         
-        # Get last week's commits (7 days before that)
-        last_week_end = week_start - timedelta(days=1)
-        last_week_start = last_week_end - timedelta(days=6)
-        last_week_commits = self.database.get_weekly_commits(
-            last_week_start.isoformat(), last_week_end.isoformat()
-        )
+        Args:
+            ctx: Reference date context
+            days: Number of days in the trend
+            daily_totals: Per-day totals covering the last two weeks and the trend
+            
+        Returns:
+            MomentumMetrics with trend analysis
+        """
+        trend_start = ctx.end_date - timedelta(days=days-1)
+        
+        # This week is the last 7 days, last week the 7 days before that
+        week_start = ctx.week_start
+        last_week_start = ctx.last_week_start
+        this_week_commits = 0
+        last_week_commits = 0
+        for day, day_commits in daily_totals.items():
+            if day >= week_start:
+                this_week_commits += day_commits
+            elif day >= last_week_start:
+                last_week_commits += day_commits
         
         # Calculate week-over-week change
         if last_week_commits > 0:
@@ -189,16 +391,14 @@ class DashboardAnalytics:
         else:
             week_change = 100.0 if this_week_commits > 0 else 0.0
         
-        # Get daily trend (last 7 days)
-        daily_trend = []
-        consistency_days = 0
-        
-        for i in range(days):
-            day = end_date - timedelta(days=days-1-i)
-            day_commits = self.database.get_total_commits_by_date(day.isoformat())
-            daily_trend.append(day_commits)
-            if day_commits > 0:
-                consistency_days += 1
+        # Get daily trend (last N days)
+        trend_ordinal = trend_start.toordinal()
+        get_day = daily_totals.get
+        daily_trend = tuple(
+            get_day(date.fromordinal(trend_ordinal + i).isoformat(), 0)
+            for i in range(days)
+        )
+        consistency_days = days - daily_trend.count(0)
         
         average_daily = sum(daily_trend) / len(daily_trend) if daily_trend else 0
         
@@ -217,11 +417,19 @@ class DashboardAnalytics:
             performance_level=performance_level
         )
     
-    def get_achievements(self, target_date: str = None) -> List[Achievement]:
+    def get_achievements(self, target_date: str = None,
+                         streak_data: Optional[StreakData] = None,
+                         momentum: Optional[MomentumMetrics] = None,
+                         categories: Optional[Tuple[str, ...]] = None) -> List[Achievement]:
         """Get current achievements and progress.
         
         Args:
             target_date: Reference date for calculations
+            streak_data: Streak data for target_date, if already computed
+            momentum: Momentum for target_date, if already computed
+            categories: Achievement categories to include ('streak', 'volume',
+                'consistency'). Defaults to all; data for skipped categories
+                is not fetched.
             
         Returns:
             List of Achievement objects
@@ -230,119 +438,93 @@ class DashboardAnalytics:
         if target_date is None:
             target_date = date.today().isoformat()
         
-        achievements = []
-        
-        # Get current metrics
-        streak_data = self.get_streak_data(target_date)
-        momentum = self.calculate_momentum(target_date)
-        
-        # Get current daily performance for volume achievements
-        today_commits = self.database.get_total_commits_by_date(target_date)
-        today_lines = self._get_daily_lines(target_date)
-        hall_of_fame = self.get_hall_of_fame(target_date)
-        
-        # Define achievements with progress calculation
-        achievement_defs = [
-            # Streak achievements
-            {
-                'id': 'first_step', 'name': 'First Step', 'emoji': '👶',
-                'description': 'Made your first commit', 'threshold': 1,
-                'current': max(streak_data.current_streak, streak_data.longest_streak)
-            },
-            {
-                'id': 'fire_starter', 'name': 'Fire Starter', 'emoji': '🔥',
-                'description': '3 day coding streak', 'threshold': 3,
-                'current': streak_data.current_streak
-            },
-            {
-                'id': 'consistent_coder', 'name': 'Consistent Coder', 'emoji': '⚡',
-                'description': '7 day coding streak', 'threshold': 7,
-                'current': streak_data.current_streak
-            },
-            {
-                'id': 'streak_master', 'name': 'Streak Master', 'emoji': '🎯',
-                'description': '21 day coding streak', 'threshold': 21,
-                'current': streak_data.current_streak
-            },
-            {
-                'id': 'code_warrior', 'name': 'Code Warrior', 'emoji': '🎖️',
-                'description': '30 day coding streak', 'threshold': 30,
-                'current': streak_data.current_streak
-            },
-            
-            # Volume achievements - Daily Commits
-            {
-                'id': 'commit_surge', 'name': 'Commit Surge', 'emoji': '💥',
-                'description': '5 commits in one day', 'threshold': 5,
-                'current': hall_of_fame.best_single_day_commits.value
-            },
-            {
-                'id': 'commit_storm', 'name': 'Commit Storm', 'emoji': '⛈️',
-                'description': '8 commits in one day', 'threshold': 8,
-                'current': hall_of_fame.best_single_day_commits.value
-            },
-            {
-                'id': 'commit_hurricane', 'name': 'Commit Hurricane', 'emoji': '🌪️',
-                'description': '12 commits in one day', 'threshold': 12,
-                'current': hall_of_fame.best_single_day_commits.value
-            },
-            {
-                'id': 'commit_legend', 'name': 'Commit Legend', 'emoji': '👑',
-                'description': '15 commits in one day', 'threshold': 15,
-                'current': hall_of_fame.best_single_day_commits.value
-            },
-            
-            # Volume achievements - Daily Lines
-            {
-                'id': 'line_crusher', 'name': 'Line Crusher', 'emoji': '💪',
-                'description': '1,000 lines in one day', 'threshold': 1000,
-                'current': hall_of_fame.best_single_day_lines.value
-            },
-            {
-                'id': 'code_beast', 'name': 'Code Beast', 'emoji': '🦁',
-                'description': '5,000 lines in one day', 'threshold': 5000,
-                'current': hall_of_fame.best_single_day_lines.value
-            },
-            {
-                'id': 'coding_machine', 'name': 'Coding Machine', 'emoji': '🤖',
-                'description': '10,000 lines in one day', 'threshold': 10000,
-                'current': hall_of_fame.best_single_day_lines.value
-            },
-            {
-                'id': 'line_god', 'name': 'Line God', 'emoji': '🚀',
-                'description': '50,000 lines in one day', 'threshold': 50000,
-                'current': hall_of_fame.best_single_day_lines.value
-            },
-            
-            # Consistency achievements
-            {
-                'id': 'perfect_week', 'name': 'Perfect Week', 'emoji': '⭐',
-                'description': '7 days of coding in a row', 'threshold': 7,
-                'current': momentum.consistency_score
-            },
-            {
-                'id': 'momentum_builder', 'name': 'Momentum Builder', 'emoji': '📈',
-                'description': 'Increased weekly commits by 25%+', 'threshold': 25,
-                'current': max(0, momentum.week_over_week_change)
-            },
-        ]
+        if categories is None:
+            categories = _ACHIEVEMENT_CATEGORIES
+        
+        # Get missing metrics; the queries are independent, so when several
+        # are needed they run together on the worker threads
+        want_streak = 'streak' in categories
+        want_volume = 'volume' in categories
+        want_consistency = 'consistency' in categories
+        queries = {}
+        if want_streak and streak_data is None:
+            queries['streak'] = self.get_streak_data
+        if want_volume:
+            queries['hall_of_fame'] = self.get_hall_of_fame
+        if want_consistency and momentum is None:
+            queries['momentum'] = self.calculate_momentum
+        if len(queries) > 1:
+            submit = self._get_executor().submit
+            futures = {name: submit(query, target_date) for name, query in queries.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {name: query(target_date) for name, query in queries.items()}
+        
+        metrics = {}
+        if want_streak:
+            streak_data = results.get('streak', streak_data)
+            metrics['best_streak'] = max(streak_data.current_streak, streak_data.longest_streak)
+            metrics['current_streak'] = streak_data.current_streak
+        if want_volume:
+            hall_of_fame = results['hall_of_fame']
+            metrics['best_day_commits'] = hall_of_fame.best_single_day_commits.value
+            metrics['best_day_lines'] = hall_of_fame.best_single_day_lines.value
+        if want_consistency:
+            momentum = results.get('momentum', momentum)
+            metrics['consistency'] = momentum.consistency_score
+            metrics['week_over_week'] = max(0, momentum.week_over_week_change)
         
         # Create achievement objects
-        for achv in achievement_defs:
-            is_unlocked = achv['current'] >= achv['threshold']
-            progress = min(1.0, achv['current'] / achv['threshold']) if not is_unlocked else None
+        achievements = []
+        for achv in _ACHIEVEMENTS:
+            if achv.metric not in metrics:
+                continue
+            current = metrics[achv.metric]
+            is_unlocked = current >= achv.threshold
+            progress = min(1.0, current / achv.threshold) if not is_unlocked else None
             
             achievements.append(Achievement(
-                id=achv['id'],
-                name=achv['name'],
-                emoji=achv['emoji'],
-                description=achv['description'],
+                id=achv.id,
+                name=achv.name,
+                emoji=achv.emoji,
+                description=achv.description,
                 unlocked_date=target_date if is_unlocked else None,
                 progress=progress
             ))
         
         return achievements
     
+    @_memoize_on_db
+    def _total_commits_on(self, target_date: str) -> int:
+        """Get total commits for a date, shared by every caller in a render.
+        
+        Args:
+            target_date: Date in YYYY-MM-DD format
+            
+        Returns:
+            Total number of commits
+        """
+        return self.database.get_total_commits_by_date(target_date)
+    
+    def _daily_commit_totals(self, start_date: str, end_date: str) -> Dict[str, int]:
+        """Get total commits per day for a date range in a single query.
+        
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            
+        Returns:
+            Dictionary mapping dates with commits to their totals
+        """
+        conn = self.database.conn
+        cursor = conn.execute("""
+            SELECT date, SUM(count)
+            FROM commits
+            WHERE date BETWEEN ? AND ?
+            GROUP BY date
+        """, (start_date, end_date))
+        return dict(cursor.fetchall())
+    
     def _get_daily_lines(self, target_date: str) -> int:
         """Get total lines of code changed on a specific date.
         
@@ -352,15 +534,16 @@ class DashboardAnalytics:
         Returns:
             Total lines added + deleted for the date
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT SUM(lines_added + lines_deleted)
-                FROM commits
-                WHERE date = ?
-            """, (target_date,))
-            result = cursor.fetchone()
-            return result[0] if result[0] is not None else 0
+        conn = self.database.conn
+        cursor = conn.execute("""
+            SELECT SUM(lines_added + lines_deleted)
+            FROM commits
+            WHERE date = ?
+        """, (target_date,))
+        result = cursor.fetchone()
+        return result[0] if result[0] is not None else 0
     
+    @_memoize_on_db
     def get_hall_of_fame(self, target_date: str = None) -> HallOfFame:
         """Get Hall of Fame with personal records and current performance.
         
@@ -373,88 +556,88 @@ class DashboardAnalytics:
         if target_date is None:
             target_date = date.today().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Get best single day for commits
-            cursor = conn.execute("""
-                SELECT date, SUM(count) as daily_commits
-                FROM commits 
-                GROUP BY date 
-                ORDER BY daily_commits DESC 
-                LIMIT 1
-            """)
-            best_commits_row = cursor.fetchone()
-            
-            if best_commits_row:
-                best_commits_record = PersonalRecord(
-                    record_type="daily_commits",
-                    value=best_commits_row[1],
-                    date=best_commits_row[0],
-                    description=f"{best_commits_row[1]} commits in one day"
-                )
-            else:
-                best_commits_record = PersonalRecord("daily_commits", 0, target_date, "No commits yet")
-            
-            # Get best single day for lines
-            cursor = conn.execute("""
-                SELECT date, SUM(lines_added + lines_deleted) as daily_lines
-                FROM commits 
-                GROUP BY date 
-                ORDER BY daily_lines DESC 
-                LIMIT 1
-            """)
-            best_lines_row = cursor.fetchone()
-            
-            if best_lines_row:
-                best_lines_record = PersonalRecord(
-                    record_type="daily_lines",
-                    value=best_lines_row[1],
-                    date=best_lines_row[0],
-                    description=f"{best_lines_row[1]:,} lines in one day"
-                )
-            else:
-                best_lines_record = PersonalRecord("daily_lines", 0, target_date, "No lines yet")
-            
-            # Get best week for commits
-            cursor = conn.execute("""
-                SELECT 
-                    date,
-                    SUM(count) OVER (
-                        ORDER BY date 
-                        ROWS BETWEEN 6 PRECEDING AND CURRENT ROW
-                    ) as week_commits
-                FROM (
-                    SELECT date, SUM(count) as count
-                    FROM commits
-                    GROUP BY date
+        conn = self.database.conn
+        # Aggregate per day once, then pick each record from that result
+        cursor = conn.execute("""
+            WITH daily AS (
+                SELECT date, SUM(count) AS commits,
+                       SUM(lines_added + lines_deleted) AS lines
+                FROM commits
+                GROUP BY date
+            ),
+            weekly AS (
+                SELECT date, SUM(commits) OVER (
                     ORDER BY date
-                )
-                ORDER BY week_commits DESC
-                LIMIT 1
-            """)
-            best_week_row = cursor.fetchone()
-            
-            if best_week_row:
-                best_week_record = PersonalRecord(
-                    record_type="weekly_commits",
-                    value=best_week_row[1],
-                    date=best_week_row[0],
-                    description=f"{best_week_row[1]} commits in one week"
-                )
-            else:
-                best_week_record = PersonalRecord("weekly_commits", 0, target_date, "No weekly data yet")
-            
-            # Get current day performance
-            current_day_commits = self.database.get_total_commits_by_date(target_date)
-            current_day_lines = self._get_daily_lines(target_date)
-            
-            # Calculate days since last record (simplified - just check if today beat a record)
-            days_since_record = 0  # Could be expanded to calculate actual days
-            
-            # Calculate progress toward beating current record
-            if best_commits_record.value > 0:
-                record_chase_progress = min(1.0, current_day_commits / best_commits_record.value)
-            else:
-                record_chase_progress = 0.0
+                    ROWS BETWEEN 6 PRECEDING AND CURRENT ROW
+                ) AS commits
+                FROM daily
+            )
+            SELECT * FROM (
+                SELECT 'daily_commits', date, commits FROM daily
+                ORDER BY commits DESC LIMIT 1
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'daily_lines', date, lines FROM daily
+                ORDER BY lines DESC LIMIT 1
+            )
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'weekly_commits', date, commits FROM weekly
+                ORDER BY commits DESC LIMIT 1
+            )
+            UNION ALL
+            SELECT 'current_commits', date, commits FROM daily WHERE date = ?
+            UNION ALL
+            SELECT 'current_lines', date, lines FROM daily WHERE date = ?
+        """, (target_date, target_date))
+        rows = {kind: (row_date, value) for kind, row_date, value in cursor.fetchall()}
+        
+        if 'daily_commits' in rows:
+            best_date, best_value = rows['daily_commits']
+            best_commits_record = PersonalRecord(
+                record_type="daily_commits",
+                value=best_value,
+                date=best_date,
+                description=f"{best_value} commits in one day"
+            )
+        else:
+            best_commits_record = PersonalRecord("daily_commits", 0, target_date, "No commits yet")
+        
+        if 'daily_lines' in rows:
+            best_date, best_value = rows['daily_lines']
+            best_lines_record = PersonalRecord(
+                record_type="daily_lines",
+                value=best_value,
+                date=best_date,
+                description=f"{best_value:,} lines in one day"
+            )
+        else:
+            best_lines_record = PersonalRecord("daily_lines", 0, target_date, "No lines yet")
+        
+        if 'weekly_commits' in rows:
+            best_date, best_value = rows['weekly_commits']
+            best_week_record = PersonalRecord(
+                record_type="weekly_commits",
+                value=best_value,
+                date=best_date,
+                description=f"{best_value} commits in one week"
+            )
+        else:
+            best_week_record = PersonalRecord("weekly_commits", 0, target_date, "No weekly data yet")
+        
+        # Get current day performance
+        current_day_commits = rows.get('current_commits', (target_date, 0))[1]
+        current_day_lines = rows.get('current_lines', (target_date, 0))[1]
+        
+        # Calculate days since last record (simplified - just check if today beat a record)
+        days_since_record = 0  # Could be expanded to calculate actual days
+        
+        # Calculate progress toward beating current record
+        if best_commits_record.value > 0:
+            record_chase_progress = min(1.0, current_day_commits / best_commits_record.value)
+        else:
+            record_chase_progress = 0.0
         
         return HallOfFame(
             best_single_day_commits=best_commits_record,
@@ -466,6 +649,7 @@ class DashboardAnalytics:
             record_chase_progress=record_chase_progress
         )
     
+    @_memoize_on_db
     def get_goal_progress(self, daily_goal: int = 5, weekly_goal: int = 35, 
                          monthly_goal: int = 100, target_date: str = None) -> GoalProgress:
         """Get progress towards daily, weekly, and monthly goals.
@@ -479,27 +663,51 @@ class DashboardAnalytics:
         Returns:
             GoalProgress with current status
         """
-        if target_date is None:
-            target_date = date.today().isoformat()
+        ctx = self._date_context(target_date)
+        start_date = min(ctx.week_start, ctx.month_start)
+        daily_totals = self._daily_commit_totals(start_date, ctx.target_date)
+        
+        return self._build_goal_progress(
+            ctx, daily_goal, weekly_goal, monthly_goal, daily_totals
+        )
+    
+    def _build_goal_progress(self, ctx: _DateContext, daily_goal: int, weekly_goal: int,
+                             monthly_goal: int, daily_totals: Dict[str, int]) -> GoalProgress:
+        """Build GoalProgress from per-day commit totals.
         
-        end_date = datetime.strptime(target_date, '%Y-%m-%d').date()
+        Args:
+            ctx: Reference date context
+            daily_goal: Target commits per day
+            weekly_goal: Target commits per week
+            monthly_goal: Target commits per month
+            daily_totals: Per-day totals covering the last 7 days and this month
+            
+        Returns:
+            GoalProgress with current status
+        """
+        target_date = ctx.target_date
+        week_start = ctx.week_start
+        month_start = ctx.month_start
         
         # Daily progress
-        daily_current = self.database.get_total_commits_by_date(target_date)
+        daily_current = daily_totals.get(target_date, 0)
         daily_progress = min(1.0, daily_current / daily_goal) if daily_goal > 0 else 0
         
+        # Weekly (last 7 days) and monthly (this month) totals
+        weekly_current = 0
+        monthly_current = 0
+        for day, day_commits in daily_totals.items():
+            if day > target_date:
+                continue
+            if day >= week_start:
+                weekly_current += day_commits
+            if day >= month_start:
+                monthly_current += day_commits
+        
         # Weekly progress (last 7 days)
-        week_start = end_date - timedelta(days=6)
-        weekly_current = self.database.get_weekly_commits(
-            week_start.isoformat(), end_date.isoformat()
-        )
         weekly_progress = min(1.0, weekly_current / weekly_goal) if weekly_goal > 0 else 0
         
         # Monthly progress (this month)
-        month_start = end_date.replace(day=1)
-        monthly_current = self.database.get_weekly_commits(
-            month_start.isoformat(), end_date.isoformat()
-        )
         monthly_progress = min(1.0, monthly_current / monthly_goal) if monthly_goal > 0 else 0
         
         return GoalProgress(
@@ -514,7 +722,50 @@ class DashboardAnalytics:
             monthly_progress=monthly_progress
         )
     
-    def generate_heatmap_data(self, days: int = 30, target_date: str = None) -> Dict[str, int]:
+    @_memoize_on_db
+    def build_dashboard(self, target_date: str = None, daily_goal: int = 5,
+                        weekly_goal: int = 35, monthly_goal: int = 100
+                        ) -> Tuple[StreakData, MomentumMetrics, GoalProgress]:
+        """Get streak, momentum and goal progress from one pass over the data.
+        
+        Equivalent to calling get_streak_data, calculate_momentum and
+        get_goal_progress, but the per-day totals they share are fetched
+        with a single query.
+        
+        Args:
+            target_date: Reference date (defaults to today)
+            daily_goal: Target commits per day
+            weekly_goal: Target commits per week
+            monthly_goal: Target commits per month
+            
+        Returns:
+            Tuple of (StreakData, MomentumMetrics, GoalProgress)
+        """
+        ctx = self._date_context(target_date)
+        
+        # Run the streak queries in the background while fetching totals
+        executor = self._get_executor()
+        current_future = executor.submit(self.database.calculate_streak, ctx.target_date)
+        longest_future = executor.submit(self._get_longest_streak)
+        
+        # Two weeks of momentum and this month's goals share one range
+        start_date = min(ctx.last_week_start, ctx.month_start)
+        daily_totals = self._daily_commit_totals(start_date, ctx.target_date)
+        
+        streak_data = self._build_streak_data(
+            current_future.result(),
+            longest_future.result(),
+            daily_totals.get(ctx.target_date, 0)
+        )
+        momentum = self._build_momentum(ctx, 7, daily_totals)
+        goal_progress = self._build_goal_progress(
+            ctx, daily_goal, weekly_goal, monthly_goal, daily_totals
+        )
+        
+        return streak_data, momentum, goal_progress
+    
+    @_memoize_on_db
+    def generate_heatmap_data(self, days: int = 30, target_date: str = None) -> Mapping[str, int]:
         """Generate heatmap data for the last N days.
         
         Args:
@@ -522,62 +773,34 @@ class DashboardAnalytics:
             target_date: End date for heatmap
             
         Returns:
-            Dictionary mapping dates to commit counts
+            Read-only mapping of dates to commit counts
         """
         if target_date is None:
             target_date = date.today().isoformat()
         
-        end_date = datetime.strptime(target_date, '%Y-%m-%d').date()
+        end_date = date.fromisoformat(target_date)
         start_date = end_date - timedelta(days=days-1)
         
-        commits = self.database.get_commits_by_date_range(
-            start_date.isoformat(), end_date.isoformat()
-        )
+        # Create date->commits mapping with every day in range present
+        start_ordinal = start_date.toordinal()
+        heatmap = {
+            date.fromordinal(start_ordinal + offset).isoformat(): 0
+            for offset in range(days)
+        }
+        heatmap.update(self._daily_commit_totals(start_date.isoformat(), end_date.isoformat()))
         
-        # Create date->commits mapping
-        heatmap = {}
-        current = start_date
-        while current <= end_date:
-            date_str = current.isoformat()
-            heatmap[date_str] = sum(
-                commit['count'] for commit in commits 
-                if commit['date'] == date_str
-            )
-            current += timedelta(days=1)
-        
-        return heatmap
+        return MappingProxyType(heatmap)
     
+    @_memoize_on_db
     def _get_longest_streak(self) -> int:
-        """Calculate the longest ever streak from database."""
+        """Get the longest ever streak from database.
+        
+        The value is kept up to date in the dashboard_meta table whenever
+        commits are written, so this is a single-row read; only databases
+        written before it was stored fall back to scanning the commits.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT DISTINCT date
-                    FROM commits 
-                    WHERE count > 0
-                    ORDER BY date ASC
-                """)
-                
-                commit_dates = [row[0] for row in cursor.fetchall()]
-                
-                if not commit_dates:
-                    return 0
-                
-                max_streak = 1
-                current_streak = 1
-                
-                for i in range(1, len(commit_dates)):
-                    prev_date = datetime.strptime(commit_dates[i-1], '%Y-%m-%d').date()
-                    curr_date = datetime.strptime(commit_dates[i], '%Y-%m-%d').date()
-                    
-                    if (curr_date - prev_date).days == 1:
-                        current_streak += 1
-                        max_streak = max(max_streak, current_streak)
-                    else:
-                        current_streak = 1
-                
-                return max_streak
-                
+            return self.database.get_longest_streak()
         except Exception:
             return 0
     
@@ -593,21 +816,12 @@ class DashboardAnalytics:
         Returns:
             PerformanceLevel enum
         """
-        # Legendary: exceptional performance across all metrics
-        if week_commits >= 50 and consistency >= 6 and daily_avg >= 7:
-            return PerformanceLevel.LEGENDARY
-        
-        # Crushing: high performance, on fire
-        elif week_commits >= 25 and consistency >= 5 and daily_avg >= 4:
-            return PerformanceLevel.CRUSHING
-        
-        # Building: moderate activity, building momentum
-        elif week_commits >= 10 and consistency >= 3 and daily_avg >= 2:
-            return PerformanceLevel.BUILDING
+        for min_week, min_consistency, min_daily_avg, level in _PERFORMANCE_THRESHOLDS:
+            if week_commits >= min_week and consistency >= min_consistency and daily_avg >= min_daily_avg:
+                return level
         
         # Starting: new user or low activity
-        else:
-            return PerformanceLevel.STARTING
+        return PerformanceLevel.STARTING
     
     def get_historical_data(self, chart_type: str = 'daily', periods: int = None) -> HistoricalData:
         """Get historical commit data for charts.
@@ -633,130 +847,114 @@ class DashboardAnalytics:
         end_date = date.today()
         start_date = end_date - timedelta(days=days-1)
         
-        # Get raw commit data
-        raw_data = self.database.get_commits_by_date_range(
-            start_date.isoformat(), 
-            end_date.isoformat()
-        )
+        # Get per-day commit totals
+        commits_by_date = self._daily_commit_totals(start_date.isoformat(), end_date.isoformat())
         
-        # Create date-to-commits mapping
-        commits_by_date = {}
-        for commit in raw_data:
-            date_key = commit['date']
-            commits_by_date[date_key] = commits_by_date.get(date_key, 0) + commit['count']
+        # Build period columns from consecutive day ordinals
+        start_ordinal = start_date.toordinal()
+        days_in_range = [date.fromordinal(start_ordinal + offset) for offset in range(days)]
+        dates = [day.isoformat() for day in days_in_range]
         
-        # Build periods list
-        periods = []
-        current_date = start_date
+        # Create readable labels (e.g., "Mar 15")
+        labels = [day.strftime("%b %d") for day in days_in_range]
+        get_commits = commits_by_date.get
+        commits = [get_commits(date_str, 0) for date_str in dates]
         
-        while current_date <= end_date:
-            date_str = current_date.isoformat()
-            commits_count = commits_by_date.get(date_str, 0)
-            
-            # Create readable label (e.g., "Mar 15")
-            label = current_date.strftime("%b %d")
-            
-            periods.append(HistoricalPeriod(
-                label=label,
-                start_date=date_str,
-                end_date=date_str,
-                commits=commits_count,
-                period_type='daily'
-            ))
-            
-            current_date += timedelta(days=1)
-        
-        return self._calculate_historical_metrics(periods, 'daily', f'Last {days} days')
+        return self._calculate_historical_metrics(
+            labels, dates, dates, commits, 'daily', f'Last {days} days'
+        )
     
     def _get_weekly_historical_data(self, weeks: int) -> HistoricalData:
         """Get weekly commit data for the last N weeks."""
-        periods = []
-        
-        for week_offset in range(weeks):
-            week_end = date.today() - timedelta(days=week_offset*7)
+        today = date.today()
+        oldest = today - timedelta(days=weeks*7 - 1)
+        
+        # Bucket every commit into its week offset from today in one query
+        conn = self.database.conn
+        cursor = conn.execute("""
+            SELECT CAST((julianday(?) - julianday(date)) / 7 AS INTEGER) AS week_offset,
+                   SUM(count)
+            FROM commits
+            WHERE date BETWEEN ? AND ?
+            GROUP BY week_offset
+        """, (today.isoformat(), oldest.isoformat(), today.isoformat()))
+        commits_by_week = dict(cursor.fetchall())
+        
+        labels, start_dates, end_dates, commits = [], [], [], []
+        
+        # Walk from the oldest week to the current one
+        for week_offset in range(weeks - 1, -1, -1):
+            week_end = today - timedelta(days=week_offset*7)
             week_start = week_end - timedelta(days=6)
             
-            # Get commits for this week
-            weekly_commits = self.database.get_weekly_commits(
-                week_start.isoformat(), 
-                week_end.isoformat()
-            )
-            
             # Create readable label (e.g., "W12")
             week_number = weeks - week_offset
-            label = f"W{week_number}"
-            
-            periods.append(HistoricalPeriod(
-                label=label,
-                start_date=week_start.isoformat(),
-                end_date=week_end.isoformat(),
-                commits=weekly_commits,
-                period_type='weekly'
-            ))
-        
-        # Reverse to show oldest first
-        periods.reverse()
+            labels.append(f"W{week_number}")
+            start_dates.append(week_start.isoformat())
+            end_dates.append(week_end.isoformat())
+            commits.append(commits_by_week.get(week_offset, 0))
         
-        return self._calculate_historical_metrics(periods, 'weekly', f'Last {weeks} weeks')
+        return self._calculate_historical_metrics(
+            labels, start_dates, end_dates, commits, 'weekly', f'Last {weeks} weeks'
+        )
     
     def _get_monthly_historical_data(self, months: int) -> HistoricalData:
         """Get monthly commit data for the last N months."""
-        periods = []
-        
-        current_date = date.today()
+        today = date.today()
+        current_month_index = today.year * 12 + today.month - 1
         
+        # Calculate (first day, last day) of each month, newest first
+        month_ranges = []
         for month_offset in range(months):
-            # Calculate target month
-            if month_offset == 0:
-                target_date = current_date
-            else:
-                target_date = current_date.replace(day=1) - timedelta(days=1)
-                for _ in range(month_offset - 1):
-                    target_date = target_date.replace(day=1) - timedelta(days=1)
-            
-            # Get first and last day of month
-            month_start = target_date.replace(day=1)
+            year, month = divmod(current_month_index - month_offset, 12)
+            month_start = date(year, month + 1, 1)
             if month_offset == 0:
                 # Current month: up to today
-                month_end = current_date
+                month_end = today
             else:
                 # Previous months: full month
-                next_month = month_start.replace(day=28) + timedelta(days=4)
-                month_end = (next_month - timedelta(days=next_month.day)).replace(day=1) + timedelta(days=31)
-                month_end = month_end.replace(day=1) - timedelta(days=1)
-            
-            # Get commits for this month
-            monthly_commits = sum(
-                commit['count'] for commit in self.database.get_commits_by_date_range(
-                    month_start.isoformat(),
-                    month_end.isoformat()
-                )
-            )
-            
+                next_year, next_month = divmod(current_month_index - month_offset + 1, 12)
+                month_end = date(next_year, next_month + 1, 1) - timedelta(days=1)
+            month_ranges.append((month_start, month_end))
+        
+        # Get commits for every month in one query
+        conn = self.database.conn
+        cursor = conn.execute("""
+            SELECT strftime('%Y-%m', date) AS month, SUM(count)
+            FROM commits
+            WHERE date BETWEEN ? AND ?
+            GROUP BY month
+        """, (month_ranges[-1][0].isoformat(), today.isoformat()))
+        commits_by_month = dict(cursor.fetchall())
+        
+        labels, start_dates, end_dates, commits = [], [], [], []
+        
+        # Walk from the oldest month to the current one
+        for month_start, month_end in reversed(month_ranges):
             # Create readable label (e.g., "March")
-            label = target_date.strftime("%B")
+            label = month_start.strftime("%B")
             if months > 12:  # Include year if spanning multiple years
-                label = target_date.strftime("%b %Y")
+                label = month_start.strftime("%b %Y")
             
-            periods.append(HistoricalPeriod(
-                label=label,
-                start_date=month_start.isoformat(),
-                end_date=month_end.isoformat(),
-                commits=monthly_commits,
-                period_type='monthly'
-            ))
-        
-        # Reverse to show oldest first
-        periods.reverse()
+            labels.append(label)
+            start_dates.append(month_start.isoformat())
+            end_dates.append(month_end.isoformat())
+            commits.append(commits_by_month.get(month_start.strftime('%Y-%m'), 0))
         
-        return self._calculate_historical_metrics(periods, 'monthly', f'Last {months} months')
+        return self._calculate_historical_metrics(
+            labels, start_dates, end_dates, commits, 'monthly', f'Last {months} months'
+        )
     
-    def _calculate_historical_metrics(self, periods: List[HistoricalPeriod], 
+    def _calculate_historical_metrics(self, labels: List[str], start_dates: List[str],
+                                    end_dates: List[str], commits: List[int],
                                     chart_type: str, date_range_label: str) -> HistoricalData:
-        """Calculate metrics and trends from historical periods."""
-        if not periods:
+        """Calculate metrics and trends from historical period columns."""
+        if not commits:
             return HistoricalData(
-                periods=[],
+                labels=[],
+                start_dates=[],
+                end_dates=[],
+                commits=[],
                 chart_type=chart_type,
                 total_commits=0,
                 peak_commits=0,
@@ -767,16 +965,18 @@ class DashboardAnalytics:
             )
         
         # Basic metrics
-        commit_counts = [p.commits for p in periods]
-        total_commits = sum(commit_counts)
-        peak_commits = max(commit_counts)
-        average_commits = total_commits / len(periods)
+        total_commits = sum(commits)
+        peak_commits = max(commits)
+        average_commits = total_commits / len(commits)
         
         # Calculate trend
-        trend_direction, trend_percentage = self._calculate_trend(commit_counts)
+        trend_direction, trend_percentage = self._calculate_trend(commits, total_commits)
         
         return HistoricalData(
-            periods=periods,
+            labels=labels,
+            start_dates=start_dates,
+            end_dates=end_dates,
+            commits=commits,
             chart_type=chart_type,
             total_commits=total_commits,
             peak_commits=peak_commits,
@@ -786,15 +986,24 @@ class DashboardAnalytics:
             date_range_label=date_range_label
         )
     
-    def _calculate_trend(self, values: List[int]) -> Tuple[str, float]:
-        """Calculate trend direction and percentage change."""
+    def _calculate_trend(self, values: List[int], total: Optional[int] = None) -> Tuple[str, float]:
+        """Calculate trend direction and percentage change.
+        
+        Args:
+            values: Commit counts per period, oldest first
+            total: Precomputed sum of values, if already known
+        """
         if len(values) < 2:
             return 'stable', 0.0
         
+        if total is None:
+            total = sum(values)
+        
         # Compare first half to second half for trend
         midpoint = len(values) // 2
-        first_half_avg = sum(values[:midpoint]) / midpoint if midpoint > 0 else 0
-        second_half_avg = sum(values[midpoint:]) / (len(values) - midpoint)
+        first_half_sum = sum(itertools.islice(values, midpoint))
+        first_half_avg = first_half_sum / midpoint if midpoint > 0 else 0
+        second_half_avg = (total - first_half_sum) / (len(values) - midpoint)
         
         if first_half_avg == 0:
             if second_half_avg > 0:
@@ -1,159 +1,391 @@
 """Visual components and rendering for the BigFoot motivational dashboard."""
 
-import math
+import bisect
+import copy
+import functools
+import itertools
 import random
-from datetime import datetime, date, timedelta
-from typing import List, Dict, Optional
-from rich.console import Console
+from datetime import date, timedelta
+from typing import List, Dict, Optional, Tuple
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.columns import Columns
-from rich.progress import Progress, BarColumn, TextColumn, MofNCompleteColumn
 from rich.align import Align
 from rich import box
 
 from .dashboard import (
     StreakData, MomentumMetrics, Achievement, GoalProgress, 
-    PerformanceLevel, DashboardAnalytics, HistoricalData, HistoricalPeriod,
+    PerformanceLevel, DashboardAnalytics, HistoricalData,
     HallOfFame, PersonalRecord
 )
 
 
+# Streak header tiers: a streak below _STREAK_TIER_BOUNDS[i] gets _STREAK_TIERS[i]
+_STREAK_TIER_BOUNDS = (1, 3, 7, 21)
+_STREAK_TIERS = (
+    ("🌱 START YOUR JOURNEY", "yellow"),
+    ("🔥 BUILDING MOMENTUM", "orange3"),
+    ("⚡ ON FIRE", "red"),
+    ("🚀 ABSOLUTELY CRUSHING IT", "bright_red"),
+    ("👑 LEGENDARY STATUS", "gold1"),
+)
+
+# Bar chart cells, each followed by the column separator
+_BAR = "██ "
+_GAP = "   "
+
+# Week-over-week change text and mood, indexed by the sign of the change
+_WEEK_CHANGE_LABELS = {
+    1: ("↗️ +{:.0f}%", "(Growing!)"),
+    0: ("→ Same", "(Steady progress!)"),
+    -1: ("↘️ {:.0f}%", "(Let's bounce back!)")
+}
+
+# Historical chart titles by chart type
+_CHART_TITLES = {
+    'daily': '📈 DAILY COMMIT HISTORY',
+    'weekly': '📊 WEEKLY COMMIT TRENDS',
+    'monthly': '📈 MONTHLY COMMIT OVERVIEW'
+}
+
+# Trend direction emoji and text
+_TREND_LABELS = {
+    'up': ('↗️', 'growth'),
+    'down': ('↘️', 'decline'),
+    'stable': ('➡️', 'stable')
+}
+
+# Momentum status line by performance level
+_PERFORMANCE_LABELS = {
+    PerformanceLevel.LEGENDARY: "🏆 LEGENDARY PERFORMANCE!",
+    PerformanceLevel.CRUSHING: "🔥 CRUSHING IT!",
+    PerformanceLevel.BUILDING: "⚡ BUILDING MOMENTUM!",
+    PerformanceLevel.STARTING: "🌱 BUILDING FOUNDATION!"
+}
+
+# Heatmap cells as styled text parts, indexed by commit count (GitHub style);
+# counts past the end use the last cell
+_HEAT_CELLS = tuple(
+    (("■", color), " ")
+    for color in (
+        "dim white",                                        # Empty/no activity
+        "green", "green",                                   # Light activity
+        "bright_green", "bright_green", "bright_green",     # Medium activity
+        "bright_yellow", "bright_yellow", "bright_yellow",  # High activity
+        "bright_red",                                       # Intense activity
+    )
+)
+_EMPTY_HEAT_CELL = ("  ",)
+
+
+@functools.lru_cache(maxsize=128)
+def _streak_header_panel(streak: int, next_milestone: int, goal_progress: float,
+                         days_to_milestone: int) -> Panel:
+    """Build the streak header panel for the given streak values.
+    
+    Panels are cached since repeated refreshes usually show the same streak;
+    callers get a copy from _fresh_panel().
+    
+    Args:
+        streak: Current streak length in days
+        next_milestone: Next milestone in days, or 0 past the last one
+        goal_progress: Progress toward the next milestone (0.0 to 1.0)
+        days_to_milestone: Days remaining until the next milestone
+        
+    Returns:
+        Rich Panel with streak visualization
+    """
+    # Dynamic title based on streak length
+    title, color = _STREAK_TIERS[bisect.bisect_right(_STREAK_TIER_BOUNDS, streak)]
+    
+    # Create progress bar for streak
+    if next_milestone > 0:
+        bar_width = 50
+        filled = int((goal_progress * bar_width))
+        
+        progress_bar = _progress_bar(filled, bar_width)
+        progress_text = f"{streak} / {next_milestone} ({goal_progress*100:.0f}%)"
+    else:
+        progress_bar = _progress_bar(50, 50)
+        progress_text = f"{streak} DAYS - UNSTOPPABLE!"
+    
+    if days_to_milestone > 0:
+        milestone_parts = (
+            (f"\n🎯 Next Milestone: {next_milestone} days ", "cyan"),
+            (f"({days_to_milestone} to go!)", "bright_cyan bold"),
+        )
+    else:
+        milestone_parts = (
+            ("\n🏆 MILESTONE ACHIEVED! ", "gold1 bold"),
+            (f"You're at {streak} days!", "bright_white"),
+        )
+    
+    # Build content in a single pass
+    content = Text.assemble(
+        (f"\n{progress_bar}\n", "bright_red bold"),
+        (f"     {streak} DAY STREAK     \n", "white bold"),
+        (f"{progress_text}\n", "bright_white"),
+        *milestone_parts
+    )
+    
+    return Panel(
+        Align.center(content),
+        title=f"[{color} bold]{title}[/{color} bold]",
+        border_style=color,
+        padding=(1, 2),
+        box=box.HEAVY
+    )
+
+# Progress bars are sliced from these rather than rebuilt character by character
+_BAR_FULL = "█" * 128
+_BAR_EMPTY = "░" * 128
+
+
+def _progress_bar(filled: int, width: int) -> str:
+    """Build a progress bar of the given width with the first cells filled."""
+    return _BAR_FULL[:filled] + _BAR_EMPTY[:max(width - filled, 0)]
+
+
+def _fresh_panel(panel: Panel) -> Panel:
+    """Copy a cached panel so callers can restyle it without touching the cache.
+    
+    Panel is mutable, so every caller gets its own shell (title, width,
+    border, box); the rendered content inside is shared and must not be
+    mutated.
+    """
+    return copy.copy(panel)
+
+
+def _cache_panel(method):
+    """Reuse a renderer's last panel content while it is given equal data.
+    
+    The dashboard dataclasses compare by value, so a freshly computed but
+    unchanged result reuses the content too; the memoized analytics results
+    are usually the very same objects, which is checked first. Only the
+    latest panel per method is kept, and it is dropped when the day rolls
+    over. Each call returns a fresh Panel around the cached content. Inputs
+    must not be mutated after being rendered.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        options = (tuple(sorted(kwargs.items())), date.today())
+        cached = self._panel_cache.get(method.__name__)
+        if cached is not None:
+            cached_args, cached_options, panel = cached
+            if (cached_options == options and len(cached_args) == len(args)
+                    and all(old is new or old == new for old, new in zip(cached_args, args))):
+                return _fresh_panel(panel)
+        
+        panel = method(self, *args, **kwargs)
+        self._panel_cache[method.__name__] = (args, options, panel)
+        return _fresh_panel(panel)
+    
+    return wrapper
+
+
+@functools.lru_cache(maxsize=32)
+def _achievements_panel(unlocked: Tuple[Tuple[str, str, str], ...],
+                        in_progress: Tuple[Tuple[str, str, str, float], ...]) -> Panel:
+    """Build the achievements panel from the rows it displays.
+    
+    Args:
+        unlocked: (emoji, name, description) of the unlocked achievements to show
+        in_progress: (emoji, name, description, progress) of achievements in progress
+        
+    Returns:
+        Rich Panel with achievements
+    """
+    content = []
+    
+    if unlocked:
+        content.append("🎉 [bright_green bold]Recently Unlocked:[/bright_green bold]")
+        
+        # Create table for unlocked achievements
+        table = Table.grid(padding=1)
+        table.add_column(style="bright_yellow", width=3)
+        table.add_column(style="bright_white", width=20)
+        table.add_column(style="dim white")
+        
+        for emoji, name, description in unlocked:
+            table.add_row(emoji, name, description)
+        
+        content.append(table)
+        content.append("")
+    
+    if in_progress:
+        content.append("🎯 [bright_cyan bold]In Progress:[/bright_cyan bold]")
+        
+        for emoji, name, description, progress in in_progress:
+            progress_pct = int(progress * 100)
+            bar_length = 20
+            filled = int(progress * bar_length)
+            
+            progress_bar = _progress_bar(filled, bar_length)
+            content.append(f"  {emoji} {name}")
+            content.append(f"    {progress_bar} {progress_pct}%")
+            content.append(f"    {description}")
+            content.append("")
+    
+    if not unlocked and not in_progress:
+        content.append("🌟 Start coding to unlock your first achievements!")
+        content.append("   Your coding journey begins with a single commit!")
+    
+    # Create a renderable group from the content
+    renderable_content = [item for item in content if item]
+    
+    return Panel(
+        Group(*renderable_content),
+        title="[bright_magenta bold]🏆 ACHIEVEMENTS[/bright_magenta bold]",
+        border_style="bright_magenta",
+        padding=(1, 2),
+        box=box.HEAVY
+    )
+
+
+class _SynonymFormatDict(dict):
+    """Format mapping that draws a random synonym for placeholders on first use."""
+    
+    def __init__(self, engine: 'MotivationalEngine', values: Dict[str, int]):
+        super().__init__(values)
+        self.engine = engine
+    
+    def __missing__(self, word: str) -> str:
+        synonym = self[word] = self.engine.get_random_synonym(word)
+        return synonym
+
+
+# Synonym dictionaries for randomization
+_SYNONYMS = {
+    'amazing': ('amazing', 'incredible', 'outstanding', 'fantastic', 'excellent', 'superb'),
+    'building': ('building', 'developing', 'creating', 'growing', 'forging', 'crafting'),
+    'streak': ('streak', 'run', 'chain', 'momentum', 'flow', 'rhythm'),
+    'progress': ('progress', 'growth', 'momentum', 'improvement', 'advancement', 'evolution'),
+    'keep': ('keep', 'maintain', 'continue', 'sustain', 'push', 'drive'),
+    'crushing': ('crushing', 'dominating', 'smashing', 'destroying', 'owning', 'killing'),
+    'going': ('going', 'moving', 'pushing', 'flowing', 'rolling', 'charging'),
+    'legendary': ('legendary', 'epic', 'unstoppable', 'godlike', 'mythical', 'insane'),
+    'power': ('power', 'strength', 'force', 'energy', 'drive', 'fire'),
+    'strong': ('strong', 'solid', 'powerful', 'robust', 'fierce', 'unstoppable'),
+    'next': ('next', 'upcoming', 'approaching', 'incoming', 'future', 'coming')
+}
+
+# Message templates for each performance level
+_TEMPLATES = {
+    PerformanceLevel.LEGENDARY: (
+        "🏆 {streak} days {strong}! You're operating on a different level now.",
+        "👑 That {commits} commits this week? Pure {legendary} performance.",
+        
+        "🔥 {streak}-day {streak} with {commits} commits? You're in beast mode!",
+        "⚡ This consistency is what separates legends from everyone else.",
+        
+        "💎 {commits} commits this week - that's {legendary} territory!",
+        "🚀 Your {power} is undeniable. {keep} this momentum {going}!",
+        
+        "🌟 {streak} days straight? You've transcended normal coding habits.",
+        "🎯 Challenge: Can you maintain this {legendary} status? I know you can!",
+        
+        "👹 {commits} commits with {consistency} active days? Monster performance!",
+        "⭐ You're not just coding - you're {building} mastery daily."
+    ),
+    PerformanceLevel.CRUSHING: (
+        "🔥 {streak} days and {commits} commits? You're absolutely {crushing} it!",
+        "💪 That {change}% growth shows your momentum is {strong}.",
+        
+        "⚡ {consistency} active days this week - your rhythm is {amazing}!",
+        "🎯 {milestone_days} days to your {next} milestone. You've got this!",
+        
+        "🚀 {commits} commits shows real commitment. {keep} that fire burning!",
+        "📈 Your {progress} is accelerating. Can you feel that {power}?",
+        
+        "💎 This {streak}-day run proves you show up when it counts.",
+        "🌟 {consistency}/7 days active? That's champion-level consistency!",
+        
+        "🔥 Week-over-week growth: {change}%! Your momentum is {building}.",
+        "⚡ You're {building} something {strong}. {next} level incoming!"
+    ),
+    PerformanceLevel.BUILDING: (
+        "⚡ {consistency} active days this week - you're finding your rhythm!",
+        "🎯 {milestone_days} days to {milestone} milestone. {progress} is happening!",
+        
+        "🌱 Your {streak}-day {streak} shows real potential. {keep} {building}!",
+        "💪 Every commit proves you're someone who follows through.",
+        
+        "📊 {commits} commits this week? Solid {progress} happening here.",
+        "🔥 You're {building} the habit of showing up daily. That's {power}!",
+        
+        "⚡ {consistency}/7 active days - momentum is clearly {building}!",
+        "🚀 This is where champions separate from average. Which are you?",
+        
+        "💎 Your consistency this week is {amazing}. {keep} it {going}!",
+        "🎯 {milestone_days} more days to level up. You're almost there!"
+    ),
+    PerformanceLevel.STARTING: (
+        "🌟 Every {legendary} coder started exactly where you are now.",
+        "🚀 You've taken the first step - that puts you ahead of most!",
+        
+        "💎 Small wins lead to big victories. Just focus on today.",
+        "⚡ The journey of a thousand commits begins with one. You're {building}!",
+        
+        "🔥 Tracking your {progress} shows you're serious about growth.",
+        "🎯 Champions aren't born - they're forged one commit at a time.",
+        
+        "🌱 Your coding journey starts now. Every expert was once a beginner.",
+        "💪 Just {keep} showing up. Consistency beats perfection every time.",
+        
+        "⭐ You're {building} something {amazing}. One day at a time wins.",
+        "🚀 Today's commit is tomorrow's momentum. Start your {streak}!"
+    )
+}
+
+# Template lines paired up; each message is a randomly chosen pair
+_TEMPLATE_PAIRS = {
+    level: tuple(zip(templates[::2], templates[1::2]))
+    for level, templates in _TEMPLATES.items()
+}
+
+
 class MotivationalEngine:
     """Dynamic motivational message generator with synonym randomization."""
     
-    def __init__(self):
-        """Initialize with synonym dictionaries and message templates."""
-        # Synonym dictionaries for randomization
-        self.synonyms = {
-            'amazing': ['amazing', 'incredible', 'outstanding', 'fantastic', 'excellent', 'superb'],
-            'building': ['building', 'developing', 'creating', 'growing', 'forging', 'crafting'],
-            'streak': ['streak', 'run', 'chain', 'momentum', 'flow', 'rhythm'],
-            'progress': ['progress', 'growth', 'momentum', 'improvement', 'advancement', 'evolution'],
-            'keep': ['keep', 'maintain', 'continue', 'sustain', 'push', 'drive'],
-            'crushing': ['crushing', 'dominating', 'smashing', 'destroying', 'owning', 'killing'],
-            'going': ['going', 'moving', 'pushing', 'flowing', 'rolling', 'charging'],
-            'legendary': ['legendary', 'epic', 'unstoppable', 'godlike', 'mythical', 'insane'],
-            'power': ['power', 'strength', 'force', 'energy', 'drive', 'fire'],
-            'strong': ['strong', 'solid', 'powerful', 'robust', 'fierce', 'unstoppable'],
-            'next': ['next', 'upcoming', 'approaching', 'incoming', 'future', 'coming']
-        }
-        
-        # Message templates for each performance level
-        self.templates = {
-            PerformanceLevel.LEGENDARY: [
-                "🏆 {streak} days {strong}! You're operating on a different level now.",
-                "👑 That {commits} commits this week? Pure {legendary} performance.",
-                
-                "🔥 {streak}-day {streak} with {commits} commits? You're in beast mode!",
-                "⚡ This consistency is what separates legends from everyone else.",
-                
-                "💎 {commits} commits this week - that's {legendary} territory!",
-                "🚀 Your {power} is undeniable. {keep} this momentum {going}!",
-                
-                "🌟 {streak} days straight? You've transcended normal coding habits.",
-                "🎯 Challenge: Can you maintain this {legendary} status? I know you can!",
-                
-                "👹 {commits} commits with {consistency} active days? Monster performance!",
-                "⭐ You're not just coding - you're {building} mastery daily."
-            ],
-            PerformanceLevel.CRUSHING: [
-                "🔥 {streak} days and {commits} commits? You're absolutely {crushing} it!",
-                "💪 That {change}% growth shows your momentum is {strong}.",
-                
-                "⚡ {consistency} active days this week - your rhythm is {amazing}!",
-                "🎯 {milestone_days} days to your {next} milestone. You've got this!",
-                
-                "🚀 {commits} commits shows real commitment. {keep} that fire burning!",
-                "📈 Your {progress} is accelerating. Can you feel that {power}?",
-                
-                "💎 This {streak}-day run proves you show up when it counts.",
-                "🌟 {consistency}/7 days active? That's champion-level consistency!",
-                
-                "🔥 Week-over-week growth: {change}%! Your momentum is {building}.",
-                "⚡ You're {building} something {strong}. {next} level incoming!"
-            ],
-            PerformanceLevel.BUILDING: [
-                "⚡ {consistency} active days this week - you're finding your rhythm!",
-                "🎯 {milestone_days} days to {milestone} milestone. {progress} is happening!",
-                
-                "🌱 Your {streak}-day {streak} shows real potential. {keep} {building}!",
-                "💪 Every commit proves you're someone who follows through.",
-                
-                "📊 {commits} commits this week? Solid {progress} happening here.",
-                "🔥 You're {building} the habit of showing up daily. That's {power}!",
-                
-                "⚡ {consistency}/7 active days - momentum is clearly {building}!",
-                "🚀 This is where champions separate from average. Which are you?",
-                
-                "💎 Your consistency this week is {amazing}. {keep} it {going}!",
-                "🎯 {milestone_days} more days to level up. You're almost there!"
-            ],
-            PerformanceLevel.STARTING: [
-                "🌟 Every {legendary} coder started exactly where you are now.",
-                "🚀 You've taken the first step - that puts you ahead of most!",
-                
-                "💎 Small wins lead to big victories. Just focus on today.",
-                "⚡ The journey of a thousand commits begins with one. You're {building}!",
-                
-                "🔥 Tracking your {progress} shows you're serious about growth.",
-                "🎯 Champions aren't born - they're forged one commit at a time.",
-                
-                "🌱 Your coding journey starts now. Every expert was once a beginner.",
-                "💪 Just {keep} showing up. Consistency beats perfection every time.",
-                
-                "⭐ You're {building} something {amazing}. One day at a time wins.",
-                "🚀 Today's commit is tomorrow's momentum. Start your {streak}!"
-            ]
-        }
+    synonyms = _SYNONYMS
+    templates = _TEMPLATES
+    template_pairs = _TEMPLATE_PAIRS
     
     def get_random_synonym(self, word: str) -> str:
         """Get random synonym for a word, fallback to original if not found."""
-        return random.choice(self.synonyms.get(word, [word]))
+        return random.choice(self.synonyms.get(word, (word,)))
     
     def format_message(self, template: str, streak_data: StreakData, momentum: MomentumMetrics) -> str:
         """Format message template with data and random synonyms."""
         # Calculate dynamic values
         change = abs(momentum.week_over_week_change)
         
-        # Create formatting dictionary with synonym randomization
-        format_dict = {
+        # Create formatting dictionary; synonyms are only drawn for the
+        # placeholders the template actually uses
+        format_dict = _SynonymFormatDict(self, {
             'streak': streak_data.current_streak,
             'commits': momentum.this_week_commits,
             'consistency': momentum.consistency_score,
             'milestone': streak_data.next_milestone,
             'milestone_days': streak_data.days_to_milestone,
-            'change': int(change),
-            
-            # Randomized synonyms
-            'amazing': self.get_random_synonym('amazing'),
-            'building': self.get_random_synonym('building'),
-            'progress': self.get_random_synonym('progress'),
-            'keep': self.get_random_synonym('keep'),
-            'crushing': self.get_random_synonym('crushing'),
-            'going': self.get_random_synonym('going'),
-            'legendary': self.get_random_synonym('legendary'),
-            'power': self.get_random_synonym('power'),
-            'strong': self.get_random_synonym('strong'),
-            'next': self.get_random_synonym('next')
-        }
-        
-        return template.format(**format_dict)
+            'change': int(change)
+        })
+        
+        return template.format_map(format_dict)
     
     def generate_message(self, performance_level: PerformanceLevel, 
                         streak_data: StreakData, momentum: MomentumMetrics) -> str:
         """Generate dynamic motivational message."""
-        templates = self.templates.get(performance_level, self.templates[PerformanceLevel.STARTING])
+        template_pairs = self.template_pairs.get(
+            performance_level, self.template_pairs[PerformanceLevel.STARTING]
+        )
         
         # Randomly select 2 lines (each template is a 2-line pair)
-        selected_pair = random.choice(list(zip(templates[::2], templates[1::2])))
-        
-        # Format both lines with data and random synonyms
-        line1 = self.format_message(selected_pair[0], streak_data, momentum)
-        line2 = self.format_message(selected_pair[1], streak_data, momentum)
+        template1, template2 = random.choice(template_pairs)
         
-        return f"{line1}\n{line2}"
+        # Format both lines in one pass with data and random synonyms
+        return self.format_message(f"{template1}\n{template2}", streak_data, momentum)
 
 
 class HistoricalChartRenderer:
@@ -178,7 +410,7 @@ class HistoricalChartRenderer:
         Returns:
             Rich Panel with ASCII chart and trend analysis
         """
-        if not historical_data.periods:
+        if not historical_data.commits:
             return Panel(
                 "📈 No commit data available for historical chart.\n"
                 "Run [cyan]bigfoot track[/cyan] to start building your history!",
@@ -197,13 +429,7 @@ class HistoricalChartRenderer:
         content = f"{chart_ascii}\n\n{trend_summary}"
         
         # Dynamic title based on chart type
-        title_map = {
-            'daily': '📈 DAILY COMMIT HISTORY',
-            'weekly': '📊 WEEKLY COMMIT TRENDS', 
-            'monthly': '📈 MONTHLY COMMIT OVERVIEW'
-        }
-        
-        title = title_map.get(historical_data.chart_type, '📊 COMMIT HISTORY')
+        title = _CHART_TITLES.get(historical_data.chart_type, '📊 COMMIT HISTORY')
         
         return Panel(
             content,
@@ -215,17 +441,13 @@ class HistoricalChartRenderer:
     
     def _generate_ascii_chart(self, historical_data: HistoricalData) -> str:
         """Generate ASCII bar chart from historical data."""
-        periods = historical_data.periods
-        if not periods:
+        commit_counts = historical_data.commits
+        if not commit_counts:
             return "No data available"
         
-        # Extract commit counts
-        commit_counts = [p.commits for p in periods]
-        max_commits = max(commit_counts) if commit_counts else 1
-        
-        # Handle edge case where all commits are 0
-        if max_commits == 0:
-            max_commits = 1
+        # Peak was already found when the metrics were calculated; handle
+        # edge case where all commits are 0
+        max_commits = historical_data.peak_commits or 1
         
         # Calculate scaling
         scale_factor = self.max_height / max_commits
@@ -233,38 +455,33 @@ class HistoricalChartRenderer:
         # Build chart from top to bottom
         chart_lines = []
         
+        scaled_heights = [commits * scale_factor for commits in commit_counts]
+        
         for level in range(self.max_height, 0, -1):
-            # Create Y-axis label
-            y_value = int((level / self.max_height) * max_commits)
-            line = f"{y_value:3d} "
+            # Create Y-axis label (integer math, no float rounding)
+            y_value = level * max_commits // self.max_height
             
-            # Add bars for each period
-            for commits in commit_counts:
-                scaled_height = commits * scale_factor
-                if scaled_height >= level:
-                    line += "██"
-                else:
-                    line += "  "
-                line += " "  # Spacing between bars
-            
-            chart_lines.append(line)
+            # Add bars for each period (each cell includes the bar spacing)
+            chart_lines.append(
+                f"{y_value:3d} " + "".join(_BAR if height >= level else _GAP for height in scaled_heights)
+            )
         
         # Add bottom axis
         axis_line = "  0 └" + "─" * (len(commit_counts) * 3) + "┘"
         chart_lines.append(axis_line)
         
         # Add period labels (smart sampling for readability)
-        label_line = self._generate_label_line(periods)
+        label_line = self._generate_label_line(historical_data.labels)
         chart_lines.append(label_line)
         
         return "\n".join(chart_lines)
     
-    def _generate_label_line(self, periods: List[HistoricalPeriod]) -> str:
+    def _generate_label_line(self, labels: List[str]) -> str:
         """Generate smart period labels that fit the chart width."""
-        if not periods:
+        if not labels:
             return ""
         
-        total_periods = len(periods)
+        total_periods = len(labels)
         
         # Smart label sampling based on number of periods
         if total_periods <= 10:
@@ -280,34 +497,23 @@ class HistoricalChartRenderer:
             # Show every 15th label for very large datasets
             step = 15
         
-        label_line = "    "  # Indent to align with chart
+        label_cells = []
         
-        for i, period in enumerate(periods):
+        for i, label in enumerate(labels):
             if i % step == 0 or i == total_periods - 1:
-                # Show this label
-                label = period.label
-                if len(label) > 6:  # Truncate long labels
-                    label = label[:6]
-                label_line += f"{label:>6}"
+                # Show this label, truncating long ones
+                label_cells.append(f"{label[:6]:>6}")
             else:
                 # Skip this label
-                label_line += "      "  # Empty space
-            
-            if i < total_periods - 1:
-                label_line += " "
+                label_cells.append("      ")  # Empty space
         
-        return label_line
+        # Indent to align with chart
+        return "    " + " ".join(label_cells)
     
     def _generate_trend_summary(self, historical_data: HistoricalData) -> str:
         """Generate trend analysis summary."""
         # Trend direction emoji and text
-        trend_map = {
-            'up': ('↗️', 'growth'),
-            'down': ('↘️', 'decline'), 
-            'stable': ('➡️', 'stable')
-        }
-        
-        trend_emoji, trend_text = trend_map.get(
+        trend_emoji, trend_text = _TREND_LABELS.get(
             historical_data.trend_direction, ('📊', 'analysis')
         )
         
@@ -354,6 +560,7 @@ class DashboardRenderer:
         self.console = console or Console()
         self.motivational_engine = MotivationalEngine()
         self.chart_renderer = HistoricalChartRenderer()
+        self._panel_cache: Dict[str, tuple] = {}
     
     def render_streak_header(self, streak_data: StreakData) -> Panel:
         """Render the main streak header with fire animation.
@@ -364,58 +571,12 @@ class DashboardRenderer:
         Returns:
             Rich Panel with streak visualization
         """
-        streak = streak_data.current_streak
-        
-        # Dynamic title based on streak length
-        if streak == 0:
-            title = "🌱 START YOUR JOURNEY"
-            color = "yellow"
-        elif streak < 3:
-            title = "🔥 BUILDING MOMENTUM"
-            color = "orange3"
-        elif streak < 7:
-            title = "⚡ ON FIRE"
-            color = "red"
-        elif streak < 21:
-            title = "🚀 ABSOLUTELY CRUSHING IT"
-            color = "bright_red"
-        else:
-            title = "👑 LEGENDARY STATUS"
-            color = "gold1"
-        
-        # Create progress bar for streak
-        if streak_data.next_milestone > 0:
-            bar_width = 50
-            filled = int((streak_data.goal_progress * bar_width))
-            empty = bar_width - filled
-            
-            progress_bar = "█" * filled + "░" * empty
-            progress_text = f"{streak} / {streak_data.next_milestone} ({streak_data.goal_progress*100:.0f}%)"
-        else:
-            progress_bar = "█" * 50
-            progress_text = f"{streak} DAYS - UNSTOPPABLE!"
-        
-        # Build content
-        content = Text()
-        content.append(f"\n{progress_bar}\n", style="bright_red bold")
-        content.append(f"     {streak} DAY STREAK     \n", style="white bold")
-        content.append(f"{progress_text}\n", style="bright_white")
-        
-        if streak_data.days_to_milestone > 0:
-            content.append(f"\n🎯 Next Milestone: {streak_data.next_milestone} days ", style="cyan")
-            content.append(f"({streak_data.days_to_milestone} to go!)", style="bright_cyan bold")
-        else:
-            content.append(f"\n🏆 MILESTONE ACHIEVED! ", style="gold1 bold")
-            content.append(f"You're at {streak} days!", style="bright_white")
-        
-        return Panel(
-            Align.center(content),
-            title=f"[{color} bold]{title}[/{color} bold]",
-            border_style=color,
-            padding=(1, 2),
-            box=box.HEAVY
-        )
+        return _fresh_panel(_streak_header_panel(
+            streak_data.current_streak, streak_data.next_milestone,
+            streak_data.goal_progress, streak_data.days_to_milestone
+        ))
     
+    @_cache_panel
     def render_momentum_section(self, momentum: MomentumMetrics) -> Panel:
         """Render momentum analysis with trend chart.
         
@@ -425,22 +586,12 @@ class DashboardRenderer:
         Returns:
             Rich Panel with momentum visualization
         """
-        # Week over week comparison
-        if momentum.week_over_week_change > 0:
-            change_emoji = "📈"
-            change_color = "green"
-            change_text = f"↗️ +{momentum.week_over_week_change:.0f}%"
-            mood_text = "(Accelerating!)" if momentum.week_over_week_change > 20 else "(Growing!)"
-        elif momentum.week_over_week_change < 0:
-            change_emoji = "📉"
-            change_color = "red"
-            change_text = f"↘️ {momentum.week_over_week_change:.0f}%"
-            mood_text = "(Let's bounce back!)"
-        else:
-            change_emoji = "➡️"
-            change_color = "blue"
-            change_text = "→ Same"
-            mood_text = "(Steady progress!)"
+        # Week over week comparison, looked up by the sign of the change
+        change = momentum.week_over_week_change
+        change_format, mood_text = _WEEK_CHANGE_LABELS[(change > 0) - (change < 0)]
+        change_text = change_format.format(change)
+        if change > 20:
+            mood_text = "(Accelerating!)"
         
         # Create mini ASCII chart
         max_commits = max(momentum.daily_trend) if momentum.daily_trend else 1
@@ -449,19 +600,15 @@ class DashboardRenderer:
         
         days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         
+        # Bar heights are computed once and each row is joined in one pass
+        heights = [
+            int((commits / max_commits) * chart_height) if max_commits > 0 else 0
+            for commits in momentum.daily_trend
+        ]
         for level in range(chart_height, 0, -1):
-            line = f"{level*2:2d} "
-            for commits in momentum.daily_trend:
-                if max_commits > 0:
-                    bar_height = (commits / max_commits) * chart_height
-                    if bar_height >= level:
-                        line += "██"
-                    else:
-                        line += "  "
-                else:
-                    line += "  "
-                line += " "
-            chart_lines.append(line)
+            chart_lines.append(
+                f"{level*2:2d} " + "".join(_BAR if height >= level else _GAP for height in heights)
+            )
         
         # Days labels
         day_line = " 0 " + "".join(f"{day[:2]} " for day in days[:len(momentum.daily_trend)])
@@ -480,12 +627,7 @@ class DashboardRenderer:
         content.append(chart)
         
         # Performance level indicator
-        level_text = {
-            PerformanceLevel.LEGENDARY: "🏆 LEGENDARY PERFORMANCE!",
-            PerformanceLevel.CRUSHING: "🔥 CRUSHING IT!",
-            PerformanceLevel.BUILDING: "⚡ BUILDING MOMENTUM!",
-            PerformanceLevel.STARTING: "🌱 BUILDING FOUNDATION!"
-        }.get(momentum.performance_level, "📊 ANALYZING PERFORMANCE")
+        level_text = _PERFORMANCE_LABELS.get(momentum.performance_level, "📊 ANALYZING PERFORMANCE")
         
         content.append("")
         content.append(f"🚀 Status: {level_text}")
@@ -511,58 +653,13 @@ class DashboardRenderer:
         unlocked = [a for a in achievements if a.unlocked_date is not None]
         in_progress = [a for a in achievements if a.unlocked_date is None and a.progress and a.progress > 0]
         
-        content = []
-        
-        if unlocked:
-            content.append("🎉 [bright_green bold]Recently Unlocked:[/bright_green bold]")
-            
-            # Create table for unlocked achievements
-            table = Table.grid(padding=1)
-            table.add_column(style="bright_yellow", width=3)
-            table.add_column(style="bright_white", width=20)
-            table.add_column(style="dim white")
-            
-            for achievement in unlocked[-3:]:  # Show last 3
-                table.add_row(
-                    achievement.emoji,
-                    achievement.name,
-                    achievement.description
-                )
-            
-            content.append(table)
-            content.append("")
-        
-        if in_progress:
-            content.append("🎯 [bright_cyan bold]In Progress:[/bright_cyan bold]")
-            
-            for achievement in in_progress[:3]:  # Show top 3
-                progress_pct = int(achievement.progress * 100)
-                bar_length = 20
-                filled = int((achievement.progress or 0) * bar_length)
-                empty = bar_length - filled
-                
-                progress_bar = "█" * filled + "░" * empty
-                content.append(f"  {achievement.emoji} {achievement.name}")
-                content.append(f"    {progress_bar} {progress_pct}%")
-                content.append(f"    {achievement.description}")
-                content.append("")
-        
-        if not unlocked and not in_progress:
-            content.append("🌟 Start coding to unlock your first achievements!")
-            content.append("   Your coding journey begins with a single commit!")
-        
-        # Create a renderable group from the content
-        from rich.console import Group
-        renderable_content = [item for item in content if item]
-        
-        return Panel(
-            Group(*renderable_content),
-            title="[bright_magenta bold]🏆 ACHIEVEMENTS[/bright_magenta bold]",
-            border_style="bright_magenta",
-            padding=(1, 2),
-            box=box.HEAVY
-        )
+        # The panel only depends on the rows shown, so identical rows reuse its content
+        return _fresh_panel(_achievements_panel(
+            tuple((a.emoji, a.name, a.description) for a in unlocked[-3:]),  # Show last 3
+            tuple((a.emoji, a.name, a.description, a.progress) for a in in_progress[:3])  # Show top 3
+        ))
     
+    @_cache_panel
     def render_goals_progress(self, goals: GoalProgress) -> Panel:
         """Render goal progress with visual progress bars.
         
@@ -577,11 +674,10 @@ class DashboardRenderer:
         # Helper function to create progress bar
         def create_progress_bar(current: int, target: int, width: int = 30) -> str:
             if target == 0:
-                return "░" * width + " (No goal set)"
+                return _progress_bar(0, width) + " (No goal set)"
             
             progress = min(1.0, current / target)
             filled = int(progress * width)
-            empty = width - filled
             
             if progress >= 1.0:
                 bar_color = "bright_green"
@@ -596,7 +692,7 @@ class DashboardRenderer:
                 bar_color = "red"
                 status = "Keep going!"
             
-            bar = "█" * filled + "░" * empty
+            bar = _progress_bar(filled, width)
             percentage = int(progress * 100)
             
             return f"[{bar_color}]{bar}[/{bar_color}] {current}/{target} ({percentage}%) {status}"
@@ -630,6 +726,7 @@ class DashboardRenderer:
             box=box.HEAVY
         )
     
+    @_cache_panel
     def render_heatmap(self, heatmap_data: Dict[str, int], days: int = 90) -> Panel:
         """Render GitHub-style activity heatmap with rectangular grid.
         
@@ -640,19 +737,6 @@ class DashboardRenderer:
         Returns:
             Rich Panel with GitHub-style heatmap visualization
         """
-        def get_heat_style(commits: int) -> tuple[str, str]:
-            """Get color and character based on commit count - GitHub style."""
-            if commits == 0:
-                return "■", "dim white"  # Empty/no activity
-            elif commits <= 2:
-                return "■", "green"      # Light activity
-            elif commits <= 5:
-                return "■", "bright_green"  # Medium activity
-            elif commits <= 8:
-                return "■", "bright_yellow"  # High activity
-            else:
-                return "■", "bright_red"     # Intense activity
-        
         if not heatmap_data:
             return Panel(
                 "📈 No activity data available yet.\n"
@@ -664,7 +748,6 @@ class DashboardRenderer:
         content = []
         
         # Calculate date range for the grid
-        from datetime import date, timedelta
         end_date = date.today()
         start_date = end_date - timedelta(days=days-1)
         
@@ -684,56 +767,55 @@ class DashboardRenderer:
         # Day labels
         day_labels = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         
-        # Build grid row by row
+        # Commit counts for each day in range, looked up once
+        day_counts = [
+            heatmap_data.get((start_date + timedelta(days=i)).isoformat(), 0)
+            for i in range(total_days)
+        ]
+        
+        # Lay the cells out week by week from the first Monday, with empty space
+        # for dates outside our range; row N is then every 7th cell from N
+        lead_days = start_date.weekday()
+        cells = [_EMPTY_HEAT_CELL] * lead_days
+        cells.extend(_HEAT_CELLS[min(commits, len(_HEAT_CELLS) - 1)] for commits in day_counts)
+        cells.extend([_EMPTY_HEAT_CELL] * (weeks_needed * 7 - len(cells)))
+        
+        # Build grid row by row as pre-styled text, so Rich has no markup to parse
         for day_of_week in range(7):  # Monday=0 to Sunday=6
-            row = f"{day_labels[day_of_week]} "
-            
-            # Build each week column for this day of week
-            current_date = first_monday + timedelta(days=day_of_week)
-            
-            for week in range(weeks_needed):
-                week_date = current_date + timedelta(weeks=week)
-                
-                # Only show squares for dates within our range and not future dates
-                if start_date <= week_date <= end_date:
-                    commits = heatmap_data.get(week_date.isoformat(), 0)
-                    char, color = get_heat_style(commits)
-                    row += f"[{color}]{char}[/{color}] "
-                else:
-                    # Empty space for dates outside our range
-                    row += "  "
-            
-            content.append(row)
+            content.append(Text.assemble(
+                f"{day_labels[day_of_week]} ",
+                *itertools.chain.from_iterable(cells[day_of_week::7])
+            ))
         
         content.append("")
         
         # Month labels (approximate, shown below the grid)
-        month_labels = []
         current_month = None
         label_positions = []
         
-        current_date = first_monday
+        one_week = timedelta(weeks=1)
+        week_date = first_monday
         for week in range(weeks_needed):
-            week_date = current_date + timedelta(weeks=week)
             if week_date.month != current_month and start_date <= week_date <= end_date:
                 current_month = week_date.month
                 month_name = week_date.strftime("%b")
                 # Position the month label
                 label_positions.append((week * 2 + 4, month_name))  # +4 for "Mon " offset
+            week_date += one_week
         
         # Create month label line
         if label_positions:
-            label_line = " " * 4  # Offset for day labels
+            label_parts = [" " * 4]  # Offset for day labels
             last_pos = 4
             for pos, month in label_positions:
                 # Add spaces to position the month label
                 spaces_needed = pos - last_pos
                 if spaces_needed > 0:
-                    label_line += " " * spaces_needed
-                label_line += month
+                    label_parts.append(" " * spaces_needed)
+                label_parts.append(month)
                 last_pos = pos + len(month)
             
-            content.append(label_line)
+            content.append("".join(label_parts))
         
         content.append("")
         
@@ -741,10 +823,15 @@ class DashboardRenderer:
         legend_line = "Less [dim white]■[/dim white] [green]■[/green] [bright_green]■[/bright_green] [bright_yellow]■[/bright_yellow] [bright_red]■[/bright_red] More"
         content.append(legend_line)
         
-        # Summary stats
-        total_commits = sum(heatmap_data.values())
-        active_days = sum(1 for count in heatmap_data.values() if count > 0)
-        total_days_in_range = len([d for d in heatmap_data.keys() if start_date.isoformat() <= d <= end_date.isoformat()])
+        # Summary stats (single pass over the data)
+        start_iso, end_iso = start_date.isoformat(), end_date.isoformat()
+        total_commits = active_days = total_days_in_range = 0
+        for day, count in heatmap_data.items():
+            total_commits += count
+            if count > 0:
+                active_days += 1
+            if start_iso <= day <= end_iso:
+                total_days_in_range += 1
         consistency = int((active_days / total_days_in_range) * 100) if total_days_in_range > 0 else 0
         
         content.append("")
@@ -758,9 +845,8 @@ class DashboardRenderer:
             # Find best streak in the period
             max_streak = 0
             current_streak = 0
-            for i in range(total_days_in_range):
-                check_date = start_date + timedelta(days=i)
-                if heatmap_data.get(check_date.isoformat(), 0) > 0:
+            for commits in day_counts[:total_days_in_range]:
+                if commits > 0:
                     current_streak += 1
                     max_streak = max(max_streak, current_streak)
                 else:
@@ -770,7 +856,9 @@ class DashboardRenderer:
                 content.append(f"🔥 [bright_red bold]{max_streak}[/bright_red bold] day longest streak in this period")
         
         return Panel(
-            "\n".join(str(line) for line in content),
+            Text("\n").join(
+                Text.from_markup(line) if isinstance(line, str) else line for line in content
+            ),
             title="[bright_green bold]📈 GITHUB-STYLE ACTIVITY HEATMAP[/bright_green bold]",
             border_style="bright_green",
             padding=(1, 2),
@@ -801,6 +889,7 @@ class DashboardRenderer:
             box=box.HEAVY
         )
     
+    @_cache_panel
     def render_hall_of_fame(self, hall_of_fame: HallOfFame) -> Panel:
         """Render Hall of Fame with personal records and current chase progress.
         
@@ -810,8 +899,6 @@ class DashboardRenderer:
         Returns:
             Rich Panel with Hall of Fame display
         """
-        from rich.console import Group
-        
         content = []
         
         # Hall of Fame header
@@ -857,9 +944,8 @@ class DashboardRenderer:
             commit_progress = min(1.0, hall_of_fame.current_day_commits / hall_of_fame.best_single_day_commits.value)
             commit_bar_length = 25
             commit_filled = int(commit_progress * commit_bar_length)
-            commit_empty = commit_bar_length - commit_filled
             
-            commit_bar = "█" * commit_filled + "░" * commit_empty
+            commit_bar = _progress_bar(commit_filled, commit_bar_length)
             content.append(f"  📊 Commits: {hall_of_fame.current_day_commits}/{hall_of_fame.best_single_day_commits.value}")
             content.append(f"    {commit_bar} {commit_progress:.0%}")
             
@@ -879,9 +965,8 @@ class DashboardRenderer:
             lines_progress = min(1.0, hall_of_fame.current_day_lines / hall_of_fame.best_single_day_lines.value)
             lines_bar_length = 25
             lines_filled = int(lines_progress * lines_bar_length)
-            lines_empty = lines_bar_length - lines_filled
             
-            lines_bar = "█" * lines_filled + "░" * lines_empty
+            lines_bar = _progress_bar(lines_filled, lines_bar_length)
             content.append(f"  📝 Lines: {hall_of_fame.current_day_lines:,}/{hall_of_fame.best_single_day_lines.value:,}")
             content.append(f"    {lines_bar} {lines_progress:.0%}")
             
@@ -903,6 +988,7 @@ class DashboardRenderer:
             box=box.HEAVY
         )
     
+    @_cache_panel
     def render_historical_chart(self, historical_data: HistoricalData) -> Panel:
         """Render historical chart using the chart renderer.
         
@@ -913,3 +999,52 @@ class DashboardRenderer:
             Rich Panel with historical chart
         """
         return self.chart_renderer.render_historical_chart(historical_data)
+    
+    def render_full_dashboard(self, streak_data: StreakData, momentum: MomentumMetrics,
+                              achievements: List[Achievement], goal_progress: GoalProgress,
+                              hall_of_fame: HallOfFame, heatmap_data: Dict[str, int],
+                              historical_data: HistoricalData, days: int = 90) -> None:
+        """Render every dashboard section with a single console print.
+        
+        Sections are composed into one Group so Rich lays out and writes
+        the whole frame at once instead of once per panel.
+        
+        Args:
+            streak_data: Current streak information
+            momentum: Momentum metrics and trends
+            achievements: List of achievements to display
+            goal_progress: Goal progress data
+            hall_of_fame: HallOfFame data with personal records
+            heatmap_data: Dictionary mapping dates to commit counts
+            historical_data: Historical data to visualize
+            days: Number of days shown in the heatmap
+        """
+        total_commits = sum(heatmap_data.values()) if heatmap_data else 0
+        
+        # 1. Streak Header (always visible)
+        panels = [self.render_streak_header(streak_data)]
+        
+        # 2. Historical Chart Section
+        panels.append(self.render_historical_chart(historical_data))
+        
+        # 3. Achievements (if any unlocked or in progress)
+        if any(a.unlocked_date is not None or (a.progress and a.progress > 0) for a in achievements):
+            panels.append(self.render_achievements(achievements))
+        
+        # 4. Hall of Fame (if user has significant history)
+        if total_commits > 10:
+            panels.append(self.render_hall_of_fame(hall_of_fame))
+        
+        # 5. Goals Progress
+        panels.append(self.render_goals_progress(goal_progress))
+        
+        # 6. Activity Heatmap (for any user with minimal activity)
+        if total_commits > 5:
+            panels.append(self.render_heatmap(heatmap_data, days=days))
+        
+        # 7. Motivational Message (always show)
+        panels.append(self.render_motivational_message(
+            momentum.performance_level, streak_data, momentum
+        ))
+        
+        self.console.print(Group(*panels))
@@ -2,11 +2,44 @@
 
 import sqlite3
 import os
+import threading
 from datetime import datetime, date
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
 
+# Consecutive dates share the same (day number - row number) group; the
+# longest run wins, the most recent one on ties
+_LONGEST_STREAK_SQL = """
+    WITH days AS (
+        SELECT DISTINCT date, CAST(julianday(date) AS INTEGER) AS day
+        FROM commits
+        WHERE count > 0
+    ),
+    islands AS (
+        SELECT date, day - ROW_NUMBER() OVER (ORDER BY day) AS grp
+        FROM days
+    )
+    SELECT COUNT(*) AS length, MAX(date) AS last_date
+    FROM islands
+    GROUP BY grp
+    ORDER BY length DESC, last_date DESC
+    LIMIT 1
+"""
+
+# Number of consecutive active days from :day (inclusive) stepping by :step,
+# walked one indexed lookup per day; 0 if :day itself is not active
+_RUN_SQL = """
+    WITH RECURSIVE run(day) AS (
+        SELECT :day WHERE EXISTS (SELECT 1 FROM commits WHERE date = :day AND count > 0)
+        UNION ALL
+        SELECT date(day, :step) FROM run
+        WHERE EXISTS (SELECT 1 FROM commits WHERE date = date(run.day, :step) AND count > 0)
+    )
+    SELECT COUNT(*) FROM run
+"""
+
+
 class Database:
     """SQLite database manager for BigFoot."""
     
@@ -24,8 +57,58 @@ class Database:
             db_path = str(data_dir / "bigfoot.db")
         
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections = []
+        self._version_conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
         self._init_database()
     
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Shared read-only connection for analytics queries.
+        
+        Opened on first use and reused afterwards so the page cache and
+        prepared statements survive between queries. Each thread gets its
+        own connection so analytics can run concurrently. Writes keep using
+        their own short-lived connections.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            conn.execute("PRAGMA cache_size = -20000")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+    
+    def data_version(self) -> int:
+        """Get a counter that changes whenever the database is written.
+        
+        Backed by SQLite's data_version pragma on one dedicated connection,
+        so values from different threads can be compared. Unlike the file's
+        mtime, it cannot miss a write.
+        """
+        with self._lock:
+            if self._version_conn is None:
+                self._version_conn = sqlite3.connect(
+                    self.db_path, check_same_thread=False, isolation_level=None
+                )
+            return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close every shared read-only connection opened so far."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            if self._version_conn is not None:
+                connections.append(self._version_conn)
+                self._version_conn = None
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+    
     def _init_database(self):
         """Initialize database schema."""
         with sqlite3.connect(self.db_path) as conn:
@@ -65,9 +148,23 @@ class Database:
                 )
             """)
             
+            # Aggregates derived from commits, kept up to date by every commit write
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS dashboard_meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            
             # Create indexes for performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_commits_date ON commits(date)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_commits_repo_date ON commits(repo, date)")
+            # Covering index so per-date aggregates never touch the table rows;
+            # it also serves plain date lookups, so the old date-only index goes
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_commits_date_count
+                ON commits(date, count, lines_added, lines_deleted)
+            """)
+            conn.execute("DROP INDEX IF EXISTS idx_commits_date")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_streaks_active ON streaks(is_active)")
             
             conn.commit()
@@ -96,6 +193,12 @@ class Database:
                     commit.get('lines_added', 0),
                     commit.get('lines_deleted', 0)
                 ))
+            
+            self._update_longest_streak(
+                conn,
+                gained={commit['date'] for commit in commits if commit['count'] > 0},
+                lost={commit['date'] for commit in commits if commit['count'] <= 0}
+            )
             conn.commit()
     
     def delete_commit_data(self, repo: str, target_date: str) -> bool:
@@ -113,9 +216,120 @@ class Database:
                 DELETE FROM commits 
                 WHERE repo = ? AND date = ?
             """, (repo, target_date))
+            deleted = cursor.rowcount > 0
             
+            if deleted:
+                self._update_longest_streak(conn, gained=set(), lost={target_date})
             conn.commit()
-            return cursor.rowcount > 0
+            return deleted
+    
+    def get_meta(self, key: str) -> Optional[int]:
+        """Get a cached aggregate from the metadata table.
+        
+        Args:
+            key: Metadata key
+            
+        Returns:
+            Stored value, or None if it is not cached
+        """
+        result = self.conn.execute(
+            "SELECT value FROM dashboard_meta WHERE key = ?", (key,)
+        ).fetchone()
+        return result[0] if result else None
+    
+    def get_longest_streak(self) -> int:
+        """Get the longest ever streak of days with commits.
+        
+        Reads the value stored by the last commit write, falling back to a
+        scan for databases written before it was stored. Never writes.
+        
+        Returns:
+            Longest streak in days
+        """
+        longest = self.get_meta('longest_streak')
+        if longest is None:
+            longest, _ = self._compute_longest_streak(self.conn)
+        return longest
+    
+    @staticmethod
+    def _compute_longest_streak(conn: sqlite3.Connection) -> Tuple[int, int]:
+        """Scan commits for the longest run of consecutive active days.
+        
+        Returns:
+            Tuple of (length in days, ordinal of its last day, 0 if none)
+        """
+        result = conn.execute(_LONGEST_STREAK_SQL).fetchone()
+        if result is None:
+            return 0, 0
+        return result[0], date.fromisoformat(result[1]).toordinal()
+    
+    @staticmethod
+    def _store_longest_streak(conn: sqlite3.Connection, longest: int, end: int) -> None:
+        """Store the longest streak and its last day inside a write transaction."""
+        conn.executemany("""
+            INSERT OR REPLACE INTO dashboard_meta (key, value)
+            VALUES (?, ?)
+        """, (('longest_streak', longest), ('longest_streak_end', end)))
+    
+    def _update_longest_streak(self, conn: sqlite3.Connection,
+                               gained: set, lost: set) -> None:
+        """Keep the stored longest streak in step with a commit write.
+        
+        Gained days only measure the runs around them, and a day at either
+        edge of the stored run extends it without walking it. A full scan
+        runs only when nothing is stored yet or a day inside the stored run
+        lost its last commits.
+        
+        Args:
+            conn: Write connection holding the open transaction
+            gained: Dates (YYYY-MM-DD) just written with commits
+            lost: Dates (YYYY-MM-DD) just deleted or written without commits
+        """
+        stored = dict(conn.execute("""
+            SELECT key, value FROM dashboard_meta
+            WHERE key IN ('longest_streak', 'longest_streak_end')
+        """).fetchall())
+        if len(stored) < 2:
+            self._store_longest_streak(conn, *self._compute_longest_streak(conn))
+            return
+        
+        longest, end = stored['longest_streak'], stored['longest_streak_end']
+        for day in lost:
+            if end - longest < date.fromisoformat(day).toordinal() <= end:
+                still_active = conn.execute(
+                    "SELECT 1 FROM commits WHERE date = ? AND count > 0 LIMIT 1", (day,)
+                ).fetchone()
+                if not still_active:
+                    self._store_longest_streak(conn, *self._compute_longest_streak(conn))
+                    return
+        
+        measured_end = None
+        for day in sorted(gained):
+            ordinal = date.fromisoformat(day).toordinal()
+            if end - longest < ordinal <= end or (measured_end and ordinal <= measured_end):
+                continue  # Already part of a run measured here or stored
+            
+            if ordinal == end + 1:
+                before = longest
+            else:
+                before = self._run_length(conn, ordinal - 1, '-1 day')
+            if ordinal == end - longest:
+                after = longest
+            else:
+                after = self._run_length(conn, ordinal + 1, '+1 day')
+            
+            measured_end = ordinal + after
+            if before + 1 + after > longest:
+                longest, end = before + 1 + after, measured_end
+        
+        if (longest, end) != (stored['longest_streak'], stored['longest_streak_end']):
+            self._store_longest_streak(conn, longest, end)
+    
+    @staticmethod
+    def _run_length(conn: sqlite3.Connection, ordinal: int, step: str) -> int:
+        """Count consecutive active days from a day (inclusive) in one direction."""
+        day = date.fromordinal(ordinal).isoformat()
+        return conn.execute(_RUN_SQL, {'day': day, 'step': step}).fetchone()[0]
     
     def get_commits_by_date(self, target_date: str) -> List[Dict]:
         """Get commits for a specific date.
@@ -209,36 +423,24 @@ class Database:
         if target_date is None:
             target_date = date.today().isoformat()
         
-        with sqlite3.connect(self.db_path) as conn:
-            # Get all dates with commits, ordered by date descending
-            cursor = conn.execute("""
-                SELECT DISTINCT date
-                FROM commits 
-                WHERE count > 0
-                ORDER BY date DESC
-            """)
-            
-            commit_dates = [row[0] for row in cursor.fetchall()]
-            
-            if not commit_dates:
-                return 0
-            
-            # Calculate streak
-            streak = 0
-            current_date = target_date
-            
-            for commit_date in commit_dates:
-                if commit_date == current_date:
-                    streak += 1
-                    # Move to previous day
-                    from datetime import datetime, timedelta
-                    current_dt = datetime.strptime(current_date, '%Y-%m-%d')
-                    current_dt -= timedelta(days=1)
-                    current_date = current_dt.strftime('%Y-%m-%d')
-                else:
-                    break
-            
-            return streak
+        # Walk days with commits newest first as whole days before
+        # target_date, stopping at the first gap
+        cursor = self.conn.execute("""
+            SELECT CAST(julianday(?) - julianday(date) AS INTEGER)
+            FROM commits 
+            WHERE count > 0
+            GROUP BY date
+            ORDER BY date DESC
+        """, (target_date,))
+        
+        # Calculate streak
+        streak = 0
+        for (days_ago,) in cursor:
+            if days_ago != streak:
+                break
+            streak += 1
+        
+        return streak
     
     def save_streak(self, start_date: str, end_date: str, length: int, streak_type: str = 'daily') -> None:
         """Save streak data to database.
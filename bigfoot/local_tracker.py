@@ -4,7 +4,7 @@ import os
 import subprocess
 import json
 import time
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional, Set
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -530,8 +530,8 @@ class LocalGitTracker:
         Returns:
             Dictionary with tracking results
         """
-        start = datetime.strptime(start_date, '%Y-%m-%d').date()
-        end = datetime.strptime(end_date, '%Y-%m-%d').date()
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
         
         all_results = []
         total_commits = 0
@@ -65,6 +65,7 @@ def _determine_chart_settings(view: str, periods: int = None, total_commits: int
 def _run_dashboard(days: int = 90, goals: str = None, view: str = 'auto', periods: int = None):
     """Execute the dashboard functionality with provided options."""
     console = get_console()
+    analytics = None
     
     try:
         # Initialize components
@@ -88,10 +89,10 @@ def _run_dashboard(days: int = 90, goals: str = None, view: str = 'auto', period
                 sys.exit(1)
         
         # Get analytics data
-        streak_data = analytics.get_streak_data()
-        momentum = analytics.calculate_momentum()
-        achievements = analytics.get_achievements()
-        goal_progress = analytics.get_goal_progress(daily_goal, weekly_goal, monthly_goal)
+        streak_data, momentum, goal_progress = analytics.build_dashboard(
+            daily_goal=daily_goal, weekly_goal=weekly_goal, monthly_goal=monthly_goal
+        )
+        achievements = analytics.get_achievements(streak_data=streak_data, momentum=momentum)
         hall_of_fame = analytics.get_hall_of_fame()
         heatmap_data = analytics.generate_heatmap_data(days)  # Use user-specified days for heatmap
         
@@ -114,60 +115,33 @@ def _run_dashboard(days: int = 90, goals: str = None, view: str = 'auto', period
             console.print()
             return
         
-        # Render dashboard sections (compact style with thick borders)
-        console.print()
-        
-        # 1. Streak Header (always visible)
-        streak_panel = renderer.render_streak_header(streak_data)
-        console.print(streak_panel)
-        
-        # 2. Historical Chart Section  
-        chart_type, chart_periods = _determine_chart_settings(view, periods, total_commits)
-        historical_data = analytics.get_historical_data(chart_type, chart_periods)
-        historical_panel = renderer.render_historical_chart(historical_data)
-        console.print(historical_panel)
-        
-        # 3. Achievements (if any unlocked)
-        unlocked_achievements = [a for a in achievements if a.unlocked_date is not None]
-        in_progress_achievements = [a for a in achievements if a.progress and a.progress > 0]
-        
-        if unlocked_achievements or in_progress_achievements:
-            achievement_panel = renderer.render_achievements(achievements)
-            console.print(achievement_panel)
-        
-        # 4. Hall of Fame (if user has significant history)
-        if total_commits > 10:  # Show Hall of Fame for users with some history
-            hall_of_fame_panel = renderer.render_hall_of_fame(hall_of_fame)
-            console.print(hall_of_fame_panel)
-        
-        # 5. Goals Progress
-        goals_panel = renderer.render_goals_progress(goal_progress)  
-        console.print(goals_panel)
-        
-        # 6. Activity Heatmap (show GitHub-style heatmap for users with some history)
-        if total_commits > 5:  # Show for any user with minimal activity
-            heatmap_panel = renderer.render_heatmap(heatmap_data, days=days)  # Use user-specified days
-            console.print(heatmap_panel)
-        
-        # 7. Motivational Message (always show)
-        motivational_panel = renderer.render_motivational_message(
-            momentum.performance_level, streak_data, momentum
-        )
-        console.print(motivational_panel)
-        
-        # Quick actions hint
-        console.print()
-        if chart_type == 'daily' and total_commits > 30:
-            console.print("⚡ [dim]Quick Actions:[/dim] [bright_green]bigfoot track[/bright_green] • [bright_cyan]bigfoot --view weekly[/bright_cyan] • [bright_magenta]bigfoot --view monthly[/bright_magenta]")
-        elif chart_type == 'weekly':
-            console.print("⚡ [dim]Quick Actions:[/dim] [bright_green]bigfoot track[/bright_green] • [bright_cyan]bigfoot --view daily[/bright_cyan] • [bright_magenta]bigfoot --view monthly[/bright_magenta]")
-        else:
-            console.print("⚡ [dim]Quick Actions:[/dim] [bright_green]bigfoot track[/bright_green] • [bright_cyan]bigfoot backfill --days 7[/bright_cyan] • [bright_yellow]bigfoot doctor[/bright_yellow]")
-        console.print()
+        # Buffer the whole frame so it reaches the terminal in a single write
+        with console:
+            # Render dashboard sections (compact style with thick borders)
+            console.print()
+            chart_type, chart_periods = _determine_chart_settings(view, periods, total_commits)
+            historical_data = analytics.get_historical_data(chart_type, chart_periods)
+            renderer.render_full_dashboard(
+                streak_data, momentum, achievements, goal_progress,
+                hall_of_fame, heatmap_data, historical_data, days=days
+            )
+            
+            # Quick actions hint
+            console.print()
+            if chart_type == 'daily' and total_commits > 30:
+                console.print("⚡ [dim]Quick Actions:[/dim] [bright_green]bigfoot track[/bright_green] • [bright_cyan]bigfoot --view weekly[/bright_cyan] • [bright_magenta]bigfoot --view monthly[/bright_magenta]")
+            elif chart_type == 'weekly':
+                console.print("⚡ [dim]Quick Actions:[/dim] [bright_green]bigfoot track[/bright_green] • [bright_cyan]bigfoot --view daily[/bright_cyan] • [bright_magenta]bigfoot --view monthly[/bright_magenta]")
+            else:
+                console.print("⚡ [dim]Quick Actions:[/dim] [bright_green]bigfoot track[/bright_green] • [bright_cyan]bigfoot backfill --days 7[/bright_cyan] • [bright_yellow]bigfoot doctor[/bright_yellow]")
+            console.print()
         
     except Exception as e:
         show_error_panel(f"Dashboard error: {str(e)}")
         sys.exit(1)
+    finally:
+        if analytics is not None:
+            analytics.close()
 
 
 @click.group(invoke_without_command=True)
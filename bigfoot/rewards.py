@@ -128,11 +128,7 @@ class RewardsEngine:
         
         # Check weekly consistency
         week_dates = self._get_week_dates(date)
-        week_commits = 0
-        
-        for week_date in week_dates:
-            commits = self.database.get_total_commits_by_date(week_date)
-            week_commits += commits
+        week_commits = self.database.get_weekly_commits(week_dates[0], week_dates[-1])
         
         # Weekly consistency milestones
         if week_commits >= 50:
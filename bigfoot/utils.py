@@ -2,7 +2,7 @@
 
 import os
 import sys
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 from typing import List, Dict, Optional
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -94,7 +94,7 @@ def get_week_dates(target_date: str = None) -> List[str]:
     if target_date is None:
         target_date = date.today().isoformat()
     
-    target = datetime.strptime(target_date, '%Y-%m-%d').date()
+    target = date.fromisoformat(target_date)
     
     # Get Monday of the week
     monday = target - timedelta(days=target.weekday())
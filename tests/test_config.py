@@ -3,6 +3,8 @@
 import pytest
 import tempfile
 import os
+import subprocess
+import sys
 from bigfoot.config import Config
 
 
@@ -95,6 +97,13 @@ settings:
         assert temp_config.get_setting('show_progress') is True
         assert temp_config.get_setting('nonexistent', 'default') == 'default'
     
+    def test_get_settings(self, temp_config):
+        """Test getting several settings at once."""
+        settings = temp_config.get_settings(
+            ['timezone', 'compact_mode', 'nonexistent'], {'nonexistent': 'default'}
+        )
+        assert settings == {'timezone': 'UTC', 'compact_mode': False, 'nonexistent': 'default'}
+    
     def test_set_setting(self, temp_config):
         """Test setting setting value."""
         temp_config.set_setting('timezone', 'EST')
@@ -144,3 +153,152 @@ settings:
         assert config.get_repositories() == []
         assert config.get_daily_goal() == 10
         assert config.get_rate_limit() == 5000
+    
+    def test_reload_after_file_change(self, temp_config):
+        """Test cached config is not reused once the file changes on disk."""
+        assert temp_config.config['settings']['daily_goal'] == 10
+        
+        with open(temp_config.config_path, 'w') as f:
+            f.write("settings:\n  daily_goal: 25\n")
+        
+        temp_config.reload()
+        assert temp_config.get_daily_goal() == 25
+    
+    def test_lazy_load(self, temp_config):
+        """Test the config file is not parsed until a value is read."""
+        config = Config(temp_config.config_path)
+        assert config.is_configured() is True
+        assert config._config is None
+        
+        config.set_setting('timezone', 'EST')
+        assert config._config is not None
+        assert config.get_setting('timezone') == 'EST'
+    
+    def test_shared_instance(self, temp_config):
+        """Test configs for the same path share one instance."""
+        assert Config(temp_config.config_path) is temp_config
+        
+        temp_config.set_setting('timezone', 'EST')
+        assert Config(temp_config.config_path).get_setting('timezone') == 'EST'
+    
+    def test_json_config_round_trip(self):
+        """Test loading and saving a JSON config file."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"settings": {"daily_goal": 7, "timezone": "UTC"}}')
+            config_path = f.name
+        
+        try:
+            config = Config(config_path)
+            assert config.get_daily_goal() == 7
+            
+            config.set_daily_goal(12)
+            config.save_config()
+            with open(config_path) as f:
+                assert '"daily_goal": 12' in f.read()
+        finally:
+            os.unlink(config_path)
+    
+    def test_json_config_skips_yaml_import(self, tmp_path):
+        """Test a JSON config is loaded and saved without importing PyYAML."""
+        config_path = tmp_path / 'config.json'
+        config_path.write_text('{"settings": {"daily_goal": 7}}')
+        
+        script = (
+            "import sys; from bigfoot.config import Config; "
+            f"config = Config({str(config_path)!r}); config.set_daily_goal(9); config.save_config(); "
+            "assert 'yaml' not in sys.modules"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, '-c', script], cwd=root, check=True)
+        assert '"daily_goal": 9' in config_path.read_text()
+    
+    def test_failed_save_removes_temp_file(self):
+        """Test a save that fails while serializing leaves no temp file behind."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write('{"settings": {"daily_goal": 7}}')
+            config_path = f.name
+        
+        try:
+            config = Config(config_path)
+            config.set_setting('unserializable', object())
+            with pytest.raises(Exception, match="Could not save config file"):
+                config.save_config()
+            assert not os.path.exists(f"{config_path}.tmp")
+            with open(config_path) as f:
+                assert '"daily_goal": 7' in f.read()
+        finally:
+            os.unlink(config_path)
+    
+    def test_settings_from_header(self):
+        """Test settings are read from the file header of a large config."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("settings:\n  daily_goal: 4\n")
+            f.write("history:\n" + "".join(f"  - entry{i}\n" for i in range(2000)))
+            config_path = f.name
+        
+        try:
+            config = Config(config_path)
+            assert config.get_daily_goal() == 4
+            assert config._config is None
+            assert config.get_setting('missing', 'default') == 'default'
+        finally:
+            os.unlink(config_path)
+    
+    def test_changed_file_reparsed(self, temp_config):
+        """Test a changed YAML file is parsed again and nothing is written beside it."""
+        from bigfoot import config as config_module
+        
+        assert temp_config.config['settings']['timezone'] == 'UTC'
+        
+        config_module._CONFIG_CACHE.clear()
+        with open(temp_config.config_path, 'a') as f:
+            f.write("\nextra: true\n")
+        temp_config.reload()
+        assert temp_config.config['extra'] is True
+        
+        directory, name = os.path.split(temp_config.config_path)
+        assert not os.path.exists(os.path.join(directory, f".{name}.pkl"))
+    
+    def test_migration_retry_after_failed_save(self, tmp_path, monkeypatch):
+        """Test a failed migrating save leaves the legacy YAML config usable."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('BIGFOOT_CONFIG_PATH', raising=False)
+        with open('config.yaml', 'w') as f:
+            f.write("settings:\n  daily_goal: 3\n")
+        
+        config = Config()
+        assert config.config_path == 'config.yaml'
+        config.set_daily_goal(8)
+        
+        # A directory in the way makes writing config.json.tmp fail
+        os.mkdir('config.json.tmp')
+        with pytest.raises(Exception):
+            config.save_config()
+        assert config.config_path == 'config.yaml'
+        assert os.path.exists('config.yaml')
+        assert not os.path.exists('config.json')
+        
+        os.rmdir('config.json.tmp')
+        config.save_config()
+        assert config.config_path == 'config.json'
+        assert not os.path.exists('config.yaml')
+        with open('config.json') as f:
+            assert '"daily_goal": 8' in f.read()
+    
+    def test_migration_skipped_for_yaml_only_values(self, tmp_path, monkeypatch):
+        """Test a legacy YAML config JSON cannot represent keeps being saved as YAML."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv('BIGFOOT_CONFIG_PATH', raising=False)
+        with open('config.yaml', 'w') as f:
+            f.write("started: 2024-01-01\nsettings:\n  daily_goal: 3\n")
+        
+        config = Config()
+        config.set_daily_goal(5)
+        config.save_config()
+        config.save_config()
+        
+        assert config.config_path == 'config.yaml'
+        assert not os.path.exists('config.json')
+        config.reload()
+        assert config.get_daily_goal() == 5
+        assert str(config.config['started']) == '2024-01-01'
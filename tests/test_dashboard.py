@@ -0,0 +1,356 @@
+"""Tests for dashboard analytics module."""
+
+import dataclasses
+import pytest
+import tempfile
+import os
+import sqlite3
+from datetime import date, timedelta
+from bigfoot.database import Database
+from bigfoot.dashboard import DashboardAnalytics, PerformanceLevel, _MEMO_MAX_ENTRIES
+
+
+class TestDashboardAnalytics:
+    """Test cases for DashboardAnalytics class."""
+    
+    @pytest.fixture
+    def temp_analytics(self):
+        """Create analytics over a temporary database for testing."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        
+        db = Database(db_path)
+        analytics = DashboardAnalytics(db)
+        yield analytics, db
+        
+        # Cleanup
+        analytics.close()
+        os.unlink(db_path)
+    
+    def test_calculate_momentum(self, temp_analytics):
+        """Test momentum uses per-day totals across repositories."""
+        analytics, db = temp_analytics
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': '2024-01-10', 'count': 3},
+            {'repo': 'user/repo2', 'date': '2024-01-10', 'count': 2},
+            {'repo': 'user/repo1', 'date': '2024-01-08', 'count': 1},
+            {'repo': 'user/repo1', 'date': '2024-01-02', 'count': 4},
+        ])
+        
+        momentum = analytics.calculate_momentum('2024-01-10')
+        assert momentum.daily_trend == (0, 0, 0, 0, 1, 0, 5)
+        assert momentum.this_week_commits == 6
+        assert momentum.last_week_commits == 4
+        assert momentum.consistency_score == 2
+        assert momentum.performance_level == PerformanceLevel.STARTING
+        
+        # A longer trend window still reports calendar weeks
+        momentum = analytics.calculate_momentum('2024-01-10', days=14)
+        assert momentum.daily_trend == (0, 0, 0, 0, 0, 4, 0, 0, 0, 0, 0, 1, 0, 5)
+        assert momentum.this_week_commits == 6
+        assert momentum.last_week_commits == 4
+    
+    def test_generate_heatmap_data(self, temp_analytics):
+        """Test heatmap covers every day in range with summed counts."""
+        analytics, db = temp_analytics
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': '2024-01-10', 'count': 3},
+            {'repo': 'user/repo2', 'date': '2024-01-10', 'count': 2},
+            {'repo': 'user/repo1', 'date': '2024-01-05', 'count': 9},
+        ])
+        
+        heatmap = analytics.generate_heatmap_data(3, '2024-01-10')
+        assert heatmap == {'2024-01-08': 0, '2024-01-09': 0, '2024-01-10': 5}
+    
+    def test_get_hall_of_fame(self, temp_analytics):
+        """Test personal records and current-day performance."""
+        analytics, db = temp_analytics
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': '2024-01-01', 'count': 6, 'lines_added': 10, 'lines_deleted': 0},
+            {'repo': 'user/repo1', 'date': '2024-01-03', 'count': 2, 'lines_added': 500, 'lines_deleted': 100},
+            {'repo': 'user/repo2', 'date': '2024-01-03', 'count': 1, 'lines_added': 5, 'lines_deleted': 5},
+        ])
+        
+        hall_of_fame = analytics.get_hall_of_fame('2024-01-03')
+        assert hall_of_fame.best_single_day_commits.value == 6
+        assert hall_of_fame.best_single_day_commits.date == '2024-01-01'
+        assert hall_of_fame.best_single_day_lines.value == 610
+        assert hall_of_fame.best_single_day_lines.date == '2024-01-03'
+        assert hall_of_fame.best_week_commits.value == 9
+        assert hall_of_fame.best_week_commits.date == '2024-01-03'
+        assert hall_of_fame.current_day_commits == 3
+        assert hall_of_fame.current_day_lines == 610
+        assert hall_of_fame.record_chase_progress == pytest.approx(0.5)
+    
+    def test_get_hall_of_fame_empty(self, temp_analytics):
+        """Test Hall of Fame defaults with no commit history."""
+        analytics, _ = temp_analytics
+        
+        hall_of_fame = analytics.get_hall_of_fame('2024-01-03')
+        assert hall_of_fame.best_single_day_commits.value == 0
+        assert hall_of_fame.best_week_commits.description == "No weekly data yet"
+        assert hall_of_fame.current_day_commits == 0
+        assert hall_of_fame.record_chase_progress == 0.0
+    
+    def test_memoized_results_refresh_after_write(self, temp_analytics):
+        """Test cached analytics are reused until the database changes."""
+        analytics, db = temp_analytics
+        db.save_commits([{'repo': 'user/repo1', 'date': '2024-01-10', 'count': 2}])
+        
+        first = analytics.calculate_momentum('2024-01-10')
+        assert analytics.calculate_momentum('2024-01-10') is first
+        
+        heatmap = analytics.generate_heatmap_data(3, '2024-01-10')
+        assert analytics.generate_heatmap_data(3, '2024-01-10') is heatmap
+        assert analytics.generate_heatmap_data(3, target_date='2024-01-10') == heatmap
+        
+        db.save_commits([{'repo': 'user/repo2', 'date': '2024-01-10', 'count': 3}])
+        assert analytics.calculate_momentum('2024-01-10').this_week_commits == 5
+        assert analytics.generate_heatmap_data(3, '2024-01-10')['2024-01-10'] == 5
+    
+    def test_memo_key_resolves_default_date(self, temp_analytics):
+        """Test a defaulted target_date shares the cache entry for today."""
+        analytics, db = temp_analytics
+        today = date.today().isoformat()
+        db.save_commits([{'repo': 'user/repo1', 'date': today, 'count': 2}])
+        
+        hall_of_fame = analytics.get_hall_of_fame()
+        assert analytics.get_hall_of_fame(today) is hall_of_fame
+        assert analytics.get_hall_of_fame(target_date=today) is hall_of_fame
+    
+    def test_memo_refreshes_when_file_stat_is_unchanged(self, temp_analytics):
+        """Test a write is noticed even if the file keeps its size and mtime."""
+        analytics, db = temp_analytics
+        db.save_commits([{'repo': 'user/repo1', 'date': '2024-01-10', 'count': 2}])
+        assert analytics.calculate_momentum('2024-01-10').this_week_commits == 2
+        
+        st = os.stat(db.db_path)
+        with sqlite3.connect(db.db_path) as conn:
+            conn.execute("UPDATE commits SET count = 3")
+        os.utime(db.db_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert os.stat(db.db_path).st_size == st.st_size
+        
+        assert analytics.calculate_momentum('2024-01-10').this_week_commits == 3
+    
+    def test_memoized_results_are_read_only_and_bounded(self, temp_analytics):
+        """Test shared cached results cannot be mutated and the cache stays bounded."""
+        analytics, db = temp_analytics
+        db.save_commits([{'repo': 'user/repo1', 'date': '2024-01-10', 'count': 2}])
+        
+        heatmap = analytics.generate_heatmap_data(3, '2024-01-10')
+        with pytest.raises(TypeError):
+            heatmap['2024-01-10'] = 99
+        momentum = analytics.calculate_momentum('2024-01-10')
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            momentum.this_week_commits = 99
+        assert isinstance(momentum.daily_trend, tuple)
+        
+        for days in range(1, _MEMO_MAX_ENTRIES * 2):
+            analytics.generate_heatmap_data(days, '2024-01-10')
+        assert len(analytics._memo) <= _MEMO_MAX_ENTRIES
+    
+    def test_get_achievements_single_query_runs_inline(self, temp_analytics):
+        """Test a lone missing query skips the worker threads, and close() stops them."""
+        analytics, db = temp_analytics
+        db.save_commits([{'repo': 'user/repo1', 'date': '2024-01-10', 'count': 3}])
+        
+        streak_data, momentum, _ = analytics.build_dashboard('2024-01-10')
+        analytics.close()
+        assert analytics._executor is None
+        
+        analytics.get_achievements('2024-01-10', streak_data, momentum)
+        assert analytics._executor is None
+        
+        analytics.get_achievements('2024-01-10')
+        assert analytics._executor is not None
+    
+    def test_longest_streak(self, temp_analytics):
+        """Test longest streak picks the longest run of consecutive days."""
+        analytics, db = temp_analytics
+        assert analytics._get_longest_streak() == 0
+        
+        dates = ['2023-12-30', '2023-12-31', '2024-01-01', '2024-01-05', '2024-01-06',
+                 '2024-02-28', '2024-02-29', '2024-03-01', '2024-03-02']
+        db.save_commits([{'repo': 'user/repo1', 'date': d, 'count': 1} for d in dates])
+        db.save_commits([
+            {'repo': 'user/repo2', 'date': '2024-01-01', 'count': 2},
+            {'repo': 'user/repo1', 'date': '2024-03-03', 'count': 0},
+        ])
+        
+        assert analytics._get_longest_streak() == 4
+    
+    def test_longest_streak_stored_on_commit_write(self, temp_analytics):
+        """Test the longest streak is stored by writes and only read by analytics."""
+        analytics, db = temp_analytics
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': d, 'count': 1}
+            for d in ('2024-01-01', '2024-01-02', '2024-01-03')
+        ])
+        assert db.get_meta('longest_streak') == 3
+        
+        version = analytics._db_version()
+        assert analytics._get_longest_streak() == 3
+        assert analytics._db_version() == version
+        
+        # Backfilling older history can create a longer streak in the past
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': d, 'count': 1}
+            for d in ('2023-06-01', '2023-06-02', '2023-06-03', '2023-06-04')
+        ])
+        assert db.get_meta('longest_streak') == 4
+        assert analytics._get_longest_streak() == 4
+        
+        db.delete_commit_data('user/repo1', '2023-06-02')
+        assert db.get_meta('longest_streak') == 3
+        assert analytics._get_longest_streak() == 3
+    
+    def test_longest_streak_without_stored_value(self, temp_analytics):
+        """Test databases without a stored value are scanned, not written."""
+        analytics, db = temp_analytics
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': d, 'count': 1}
+            for d in ('2024-01-01', '2024-01-02')
+        ])
+        with sqlite3.connect(db.db_path) as conn:
+            conn.execute("DELETE FROM dashboard_meta")
+        
+        version = analytics._db_version()
+        assert analytics._get_longest_streak() == 2
+        assert db.get_meta('longest_streak') is None
+        assert analytics._db_version() == version
+    
+    def test_calculate_trend(self, temp_analytics):
+        """Test trend compares the first and second half averages."""
+        analytics, _ = temp_analytics
+        assert analytics._calculate_trend([5]) == ('stable', 0.0)
+        assert analytics._calculate_trend([0, 0, 3]) == ('up', 100.0)
+        assert analytics._calculate_trend([2, 2, 3, 3]) == ('up', 50.0)
+        assert analytics._calculate_trend([4, 4, 1, 1], 10) == ('down', 75.0)
+        assert analytics._calculate_trend([10, 10, 10]) == ('stable', 0.0)
+    
+    def test_daily_historical_data(self, temp_analytics):
+        """Test daily history has one labelled period per day, oldest first."""
+        analytics, db = temp_analytics
+        today = date.today()
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': today.isoformat(), 'count': 2},
+            {'repo': 'user/repo2', 'date': today.isoformat(), 'count': 1},
+            {'repo': 'user/repo1', 'date': (today - timedelta(days=2)).isoformat(), 'count': 4},
+        ])
+        
+        history = analytics.get_historical_data('daily', 3)
+        assert history.commits == [4, 0, 3]
+        assert history.start_dates == history.end_dates
+        assert history.end_dates[-1] == today.isoformat()
+        assert history.labels[-1] == today.strftime("%b %d")
+    
+    def test_weekly_historical_data(self, temp_analytics):
+        """Test weekly history buckets commits into 7-day windows ending today."""
+        analytics, db = temp_analytics
+        today = date.today()
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': today.isoformat(), 'count': 2},
+            {'repo': 'user/repo2', 'date': (today - timedelta(days=6)).isoformat(), 'count': 3},
+            {'repo': 'user/repo1', 'date': (today - timedelta(days=7)).isoformat(), 'count': 4},
+            {'repo': 'user/repo1', 'date': (today - timedelta(days=21)).isoformat(), 'count': 9},
+        ])
+        
+        history = analytics.get_historical_data('weekly', 3)
+        assert history.commits == [0, 4, 5]
+        assert [p.commits for p in history.periods] == [0, 4, 5]
+        assert {p.period_type for p in history.periods} == {'weekly'}
+        assert [p.label for p in history.periods] == ['W1', 'W2', 'W3']
+        assert history.periods[-1].end_date == today.isoformat()
+        assert history.total_commits == 9
+    
+    def test_monthly_historical_data(self, temp_analytics):
+        """Test monthly history uses calendar month boundaries."""
+        analytics, db = temp_analytics
+        this_month = date.today().replace(day=1)
+        last_month_end = this_month - timedelta(days=1)
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': this_month.isoformat(), 'count': 2},
+            {'repo': 'user/repo1', 'date': last_month_end.isoformat(), 'count': 3},
+            {'repo': 'user/repo1', 'date': last_month_end.replace(day=1).isoformat(), 'count': 4},
+        ])
+        
+        history = analytics.get_historical_data('monthly', 14)
+        assert len(history.periods) == 14
+        assert [p.commits for p in history.periods[-2:]] == [7, 2]
+        assert history.periods[-2].start_date == last_month_end.replace(day=1).isoformat()
+        assert history.periods[-2].end_date == last_month_end.isoformat()
+        assert history.periods[-1].end_date == date.today().isoformat()
+        assert history.periods[-1].label == this_month.strftime("%b %Y")
+        oldest_year, oldest_month = divmod(this_month.year * 12 + this_month.month - 14, 12)
+        assert history.periods[0].start_date == date(oldest_year, oldest_month + 1, 1).isoformat()
+    
+    def test_get_achievements(self, temp_analytics):
+        """Test achievements unlock against their metric thresholds."""
+        analytics, db = temp_analytics
+        today = date.today()
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': (today - timedelta(days=i)).isoformat(),
+             'count': 6, 'lines_added': 300}
+            for i in range(4)
+        ])
+        
+        achievements = {a.id: a for a in analytics.get_achievements()}
+        assert len(achievements) == 15
+        assert achievements['first_step'].unlocked_date == today.isoformat()
+        assert achievements['fire_starter'].unlocked_date == today.isoformat()
+        assert achievements['commit_surge'].unlocked_date == today.isoformat()
+        assert achievements['consistent_coder'].unlocked_date is None
+        assert achievements['consistent_coder'].progress == pytest.approx(4 / 7)
+        assert achievements['line_crusher'].progress == pytest.approx(0.3)
+        
+        streak_only = analytics.get_achievements(categories=('streak',))
+        assert [a.id for a in streak_only] == [
+            'first_step', 'fire_starter', 'consistent_coder', 'streak_master', 'code_warrior'
+        ]
+        
+        # Precomputed inputs from build_dashboard give the same result
+        streak_data, momentum, _ = analytics.build_dashboard()
+        assert analytics.get_achievements(streak_data=streak_data, momentum=momentum) == \
+            list(achievements.values())
+    
+    def test_streak_milestones(self, temp_analytics):
+        """Test the next milestone is the first one above the current streak."""
+        analytics, db = temp_analytics
+        today = date.today()
+        assert analytics.get_streak_data().next_milestone == 7
+        
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': (today - timedelta(days=i)).isoformat(), 'count': 1}
+            for i in range(7)
+        ])
+        streak_data = analytics.get_streak_data()
+        assert streak_data.next_milestone == 14
+        assert streak_data.days_to_milestone == 7
+        assert streak_data.goal_progress == pytest.approx(0.5)
+    
+    def test_categorize_performance(self, temp_analytics):
+        """Test performance levels require every threshold to be met."""
+        analytics, _ = temp_analytics
+        assert analytics._categorize_performance(50, 6, 7) == PerformanceLevel.LEGENDARY
+        assert analytics._categorize_performance(50, 5, 7) == PerformanceLevel.CRUSHING
+        assert analytics._categorize_performance(10, 3, 2) == PerformanceLevel.BUILDING
+        assert analytics._categorize_performance(9, 7, 9) == PerformanceLevel.STARTING
+    
+    def test_build_dashboard_matches_individual_calls(self, temp_analytics):
+        """Test the fused dashboard pass agrees with the separate methods."""
+        analytics, db = temp_analytics
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': '2024-01-31', 'count': 2},
+            {'repo': 'user/repo1', 'date': '2024-02-01', 'count': 3},
+            {'repo': 'user/repo2', 'date': '2024-02-02', 'count': 4},
+            {'repo': 'user/repo1', 'date': '2024-01-22', 'count': 7},
+        ])
+        
+        streak_data, momentum, goal_progress = analytics.build_dashboard('2024-02-02', 2, 10, 5)
+        assert streak_data == analytics.get_streak_data('2024-02-02')
+        assert momentum == analytics.calculate_momentum('2024-02-02')
+        assert goal_progress == analytics.get_goal_progress(2, 10, 5, '2024-02-02')
+        assert streak_data.current_streak == 3
+        assert (goal_progress.daily_current, goal_progress.weekly_current,
+                goal_progress.monthly_current) == (4, 9, 7)
+        assert (momentum.this_week_commits, momentum.last_week_commits) == (9, 7)
@@ -0,0 +1,185 @@
+"""Tests for dashboard rendering module."""
+
+import pytest
+import tempfile
+import os
+import io
+import dataclasses
+from rich.console import Console
+from bigfoot.database import Database
+from bigfoot.dashboard import (
+    DashboardAnalytics, StreakData, Achievement, MomentumMetrics, PerformanceLevel
+)
+from bigfoot.dashboard_visuals import DashboardRenderer, MotivationalEngine
+
+
+class TestDashboardRenderer:
+    """Test cases for DashboardRenderer class."""
+    
+    @pytest.fixture
+    def temp_analytics(self):
+        """Create analytics over a temporary database for testing."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        
+        db = Database(db_path)
+        analytics = DashboardAnalytics(db)
+        yield analytics, db
+        
+        # Cleanup
+        analytics.close()
+        os.unlink(db_path)
+    
+    def test_render_full_dashboard_prints_once(self, temp_analytics, monkeypatch):
+        """Test the full dashboard is written with a single console print."""
+        analytics, db = temp_analytics
+        db.save_commits([
+            {'repo': 'user/repo1', 'date': '2024-01-09', 'count': 6},
+            {'repo': 'user/repo1', 'date': '2024-01-10', 'count': 8},
+        ])
+        
+        console = Console(file=io.StringIO(), width=100)
+        renderer = DashboardRenderer(console)
+        calls = []
+        original_print = console.print
+        monkeypatch.setattr(console, 'print', lambda *a, **k: (calls.append(a), original_print(*a, **k)))
+        
+        streak_data, momentum, goal_progress = analytics.build_dashboard('2024-01-10')
+        renderer.render_full_dashboard(
+            streak_data, momentum,
+            analytics.get_achievements('2024-01-10', streak_data, momentum),
+            goal_progress, analytics.get_hall_of_fame(),
+            {'2024-01-09': 6, '2024-01-10': 8},
+            analytics.get_historical_data('daily', 7), days=7
+        )
+        
+        assert len(calls) == 1
+        output = console.file.getvalue()
+        assert 'HALL OF FAME' in output
+    
+    def test_render_streak_header_tiers(self):
+        """Test streak header titles follow the tier boundaries and are cached."""
+        renderer = DashboardRenderer(Console(file=io.StringIO()))
+        
+        def header(streak):
+            return renderer.render_streak_header(StreakData(
+                current_streak=streak, longest_streak=streak, next_milestone=0,
+                goal_progress=1.0, days_to_milestone=0, is_active_today=True
+            ))
+        
+        assert 'START YOUR JOURNEY' in header(0).title
+        assert 'BUILDING MOMENTUM' in header(2).title
+        assert 'ON FIRE' in header(3).title
+        assert 'ABSOLUTELY CRUSHING IT' in header(20).title
+        assert 'LEGENDARY STATUS' in header(21).title
+        assert header(21).renderable is header(21).renderable
+    
+    def test_panels_cached_for_same_data(self, temp_analytics):
+        """Test panel content is reused only while equal data is rendered."""
+        analytics, db = temp_analytics
+        db.save_commits([{'repo': 'user/repo1', 'date': '2024-01-10', 'count': 3}])
+        renderer = DashboardRenderer(Console(file=io.StringIO()))
+        
+        hall_of_fame = analytics.get_hall_of_fame()
+        panel = renderer.render_hall_of_fame(hall_of_fame).renderable
+        assert renderer.render_hall_of_fame(hall_of_fame).renderable is panel
+        assert renderer.render_hall_of_fame(analytics.get_hall_of_fame()).renderable is panel
+        
+        heatmap_data = {'2024-01-10': 3}
+        heatmap = renderer.render_heatmap(heatmap_data, days=30).renderable
+        assert renderer.render_heatmap(heatmap_data, days=30).renderable is heatmap
+        assert renderer.render_heatmap(dict(heatmap_data), days=30).renderable is heatmap
+        assert renderer.render_heatmap(heatmap_data, days=60).renderable is not heatmap
+        assert renderer.render_heatmap({'2024-01-10': 4}, days=60).renderable is not heatmap
+        
+        goals = analytics.get_goal_progress(3, 15, 60, '2024-01-10')
+        goals_panel = renderer.render_goals_progress(goals).renderable
+        assert renderer.render_goals_progress(dataclasses.replace(goals)).renderable is goals_panel
+        assert renderer.render_goals_progress(
+            dataclasses.replace(goals, daily_current=goals.daily_current + 1)
+        ).renderable is not goals_panel
+    
+    def test_cached_panels_are_fresh_per_call(self, temp_analytics):
+        """Test restyling a returned panel does not leak into later renders."""
+        analytics, db = temp_analytics
+        db.save_commits([{'repo': 'user/repo1', 'date': '2024-01-10', 'count': 3}])
+        renderer = DashboardRenderer(Console(file=io.StringIO()))
+        
+        hall_of_fame = analytics.get_hall_of_fame('2024-01-10')
+        panel = renderer.render_hall_of_fame(hall_of_fame)
+        title = panel.title
+        panel.title = "changed"
+        panel.width = 10
+        again = renderer.render_hall_of_fame(hall_of_fame)
+        assert again is not panel
+        assert again.title == title and again.width is None
+        
+        streak_data = StreakData(
+            current_streak=3, longest_streak=3, next_milestone=7,
+            goal_progress=3 / 7, days_to_milestone=4, is_active_today=True
+        )
+        header = DashboardRenderer(Console(file=io.StringIO())).render_streak_header(streak_data)
+        header.border_style = "blue"
+        assert renderer.render_streak_header(streak_data).border_style != "blue"
+    
+    def test_render_achievements_reuses_panel_for_same_rows(self):
+        """Test achievement panel content is shared when the displayed rows match."""
+        renderer = DashboardRenderer(Console(file=io.StringIO()))
+        
+        def achievements(progress):
+            return [
+                Achievement('week_warrior', 'Week Warrior', '7-day streak', '🔥', '2024-01-10'),
+                Achievement('century', 'Century Club', '100 commits in a day', '💯', None, progress),
+            ]
+        
+        panel = renderer.render_achievements(achievements(0.5)).renderable
+        assert renderer.render_achievements(achievements(0.5)).renderable is panel
+        assert renderer.render_achievements(achievements(0.6)).renderable is not panel
+
+
+class TestMotivationalEngine:
+    """Test cases for MotivationalEngine class."""
+    
+    def test_format_message_draws_only_used_synonyms(self, monkeypatch):
+        """Test synonyms are drawn only for placeholders in the template."""
+        engine = MotivationalEngine()
+        drawn = []
+        monkeypatch.setattr(engine, 'get_random_synonym', lambda word: drawn.append(word) or word.upper())
+        
+        streak_data = StreakData(
+            current_streak=12, longest_streak=12, next_milestone=14,
+            goal_progress=0.5, days_to_milestone=2, is_active_today=True
+        )
+        momentum = MomentumMetrics(
+            this_week_commits=30, last_week_commits=20, week_over_week_change=50.0,
+            daily_trend=(4,) * 7, average_daily=4.3, consistency_score=7,
+            performance_level=PerformanceLevel.LEGENDARY
+        )
+        
+        message = engine.format_message(
+            "{streak} days {strong}, {strong} {change}% and {commits} commits",
+            streak_data, momentum
+        )
+        assert message == "12 days STRONG, STRONG 50% and 30 commits"
+        assert drawn == ['strong']
+    
+    def test_generate_message_formats_both_lines(self):
+        """Test a message is two formatted template lines for the level."""
+        engine = MotivationalEngine()
+        streak_data = StreakData(
+            current_streak=3, longest_streak=5, next_milestone=7,
+            goal_progress=3 / 7, days_to_milestone=4, is_active_today=True
+        )
+        momentum = MomentumMetrics(
+            this_week_commits=9, last_week_commits=9, week_over_week_change=0.0,
+            daily_trend=(1,) * 7, average_daily=1.3, consistency_score=4,
+            performance_level=PerformanceLevel.BUILDING
+        )
+        
+        line1, line2 = engine.generate_message(PerformanceLevel.BUILDING, streak_data, momentum).split('\n')
+        pairs = engine.template_pairs[PerformanceLevel.BUILDING]
+        assert any(
+            line1.startswith(first.split(' ')[0]) and line2.startswith(second.split(' ')[0])
+            for first, second in pairs
+        )
+        assert '{' not in line1 + line2
@@ -3,6 +3,7 @@
 import pytest
 import tempfile
 import os
+import threading
 from datetime import date, timedelta
 from bigfoot.database import Database
 
@@ -20,6 +21,7 @@ class TestDatabase:
         yield db
         
         # Cleanup
+        db.close()
         os.unlink(db_path)
     
     def test_database_initialization(self, temp_db):
@@ -34,6 +36,61 @@ class TestDatabase:
         assert 'streaks' in tables
         assert 'rewards' in tables
     
+    def test_redundant_date_index_dropped(self, temp_db):
+        """Test the date-only index is dropped, including from older databases."""
+        import sqlite3
+        
+        with sqlite3.connect(temp_db.db_path) as conn:
+            conn.execute("CREATE INDEX idx_commits_date ON commits(date)")
+        
+        Database(temp_db.db_path)
+        with sqlite3.connect(temp_db.db_path) as conn:
+            indexes = [row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='commits'"
+            )]
+        assert 'idx_commits_date' not in indexes
+        assert 'idx_commits_date_count' in indexes
+    
+    def test_daily_aggregates_use_covering_index(self, temp_db):
+        """Test per-date aggregates are answered from the covering index."""
+        import sqlite3
+        
+        queries = [
+            ("SELECT SUM(lines_added + lines_deleted) FROM commits WHERE date = ?",
+             ('2024-01-01',)),
+            ("SELECT date, SUM(count) FROM commits WHERE date BETWEEN ? AND ? GROUP BY date",
+             ('2024-01-01', '2024-01-31')),
+            ("SELECT DISTINCT date FROM commits WHERE count > 0 ORDER BY date DESC", ()),
+        ]
+        
+        with sqlite3.connect(temp_db.db_path) as conn:
+            for sql, params in queries:
+                plan = conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+                assert any('COVERING INDEX idx_commits_date_count' in row[-1] for row in plan), sql
+    
+    def test_shared_connection(self, temp_db):
+        """Test the shared read connection is reused and sees later writes."""
+        import sqlite3
+        
+        conn = temp_db.conn
+        assert temp_db.conn is conn
+        
+        other = []
+        worker = threading.Thread(target=lambda: other.append(temp_db.conn))
+        worker.start()
+        worker.join()
+        assert other[0] is not conn
+        
+        temp_db.save_commits([{'repo': 'user/repo1', 'date': '2024-01-01', 'count': 4}])
+        assert conn.execute("SELECT SUM(count) FROM commits").fetchone()[0] == 4
+        
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM commits")
+        
+        temp_db.close()
+        assert temp_db.conn is not conn
+        temp_db.close()
+    
     def test_save_commits(self, temp_db):
         """Test saving commit data."""
         commits = [
@@ -63,6 +120,36 @@ class TestDatabase:
         assert saved_commits[1]['repo'] == 'user/repo2'
         assert saved_commits[1]['count'] == 3
     
+    def test_longest_streak_kept_up_to_date(self, temp_db):
+        """Test the stored longest streak follows merges, splits and deletes."""
+        def save(*days, count=1, repo='user/repo1'):
+            temp_db.save_commits([
+                {'repo': repo, 'date': f'2024-01-{day:02d}', 'count': count} for day in days
+            ])
+        
+        save(1, 2, 3)
+        save(6, 7)
+        assert temp_db.get_longest_streak() == 3
+        
+        # Filling the gap merges both runs
+        save(4, 5)
+        assert temp_db.get_longest_streak() == 7
+        save(4, repo='user/repo2')
+        
+        # Another repository keeps the day active
+        temp_db.delete_commit_data('user/repo1', '2024-01-04')
+        assert temp_db.get_longest_streak() == 7
+        
+        temp_db.delete_commit_data('user/repo2', '2024-01-04')
+        assert temp_db.get_longest_streak() == 3
+        
+        save(20, 21, 22, 23)
+        save(21, count=0)
+        assert temp_db.get_longest_streak() == 3
+        
+        save(21)
+        assert temp_db.get_longest_streak() == 4
+    
     def test_get_total_commits_by_date(self, temp_db):
         """Test getting total commits for a date."""
         commits = [
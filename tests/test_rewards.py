@@ -35,6 +35,7 @@ settings:
         yield rewards, database, config
         
         # Cleanup
+        database.close()
         os.unlink(db_path)
         os.unlink(config_path)
     